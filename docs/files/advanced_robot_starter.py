@@ -0,0 +1,20 @@
+"""
+Advanced Robot Starter Template
+ICTPRG430 - Week 5: Advanced Class Features
+
+Starting point for the Week 5 hands-on task. Students complete the
+__str__ and __repr__ methods.
+"""
+
+class AdvancedRobot:
+    def __init__(self, robot_id, battery_level):
+        self._robot_id = robot_id
+        self._battery_level = battery_level
+    
+    def __str__(self):
+        # TODO: Return user-friendly string
+        pass
+    
+    def __repr__(self):
+        # TODO: Return developer-friendly string
+        pass
@@ -4,31 +4,151 @@ ICTPRG430 - Week 4: Object Model & Class Fundamentals
 
 This file contains complete implementations of the classes discussed in Session 4,
 serving as reference examples for students.
+
+The methods of each class are defined on a base class with an empty
+__slots__ (IRSensorBase, LidarBase, RobotBase, EPuckRobotBase). The classes
+students use add a regular per-instance __dict__; slotted_classes.py builds
+__dict__-free variants on the same bases.
 """
 
+import asyncio
+import hashlib
+import logging
 import random
 import math
+import secrets
+import struct
+import sys
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python code paths are used instead
+    np = None
+
+# Sensor readings are logged rather than printed, so controllers running at
+# high rates pay nothing for them unless logging is enabled (see __main__)
+logger = logging.getLogger(__name__)
+
+
+def _require_numpy(feature: str):
+    """Raise a helpful error if a NumPy-only feature is used without NumPy."""
+    if np is None:
+        raise ImportError(f"{feature} requires NumPy (pip install numpy)")
+
+
+def spawn_seeds(fleet_seed=None, count: int = 1) -> list:
+    """
+    Derive independent per-sensor seeds from a single fleet-level seed.
+    
+    Give each simulated sensor (or each simulation in a process pool) one of
+    these seeds and any single run can be reproduced bit-for-bit from the
+    fleet seed and its position.
+    
+    The seeds are cut from one SHAKE-128 hash of the fleet seed, which takes
+    a few microseconds, and are the same with or without NumPy.
+    
+    Args:
+        fleet_seed (int): Fleet-level seed (default: fresh OS entropy)
+        count (int): Number of seeds to derive
+        
+    Returns:
+        list: 128-bit int seeds
+    """
+    root = f"spawn_seeds:{_resolve_seed(fleet_seed)}".encode()
+    stream = hashlib.shake_128(root).digest(16 * count)
+    return [int.from_bytes(stream[i:i + 16], 'little') for i in range(0, len(stream), 16)]
+
+
+def _resolve_seed(seed=None) -> int:
+    """
+    Turn a seed argument into a fixed int.
+    
+    None draws fresh OS entropy and a numpy.random.SeedSequence is reduced to
+    128 bits of its state, so a generator made from the result later gives
+    the same stream as one made now.
+    """
+    if seed is None:
+        return secrets.randbits(128)
+    if np is not None and isinstance(seed, np.random.SeedSequence):
+        return int.from_bytes(seed.generate_state(4).tobytes(), 'little')
+    return seed
+
+
+def _make_generator(seed=None):
+    """
+    Create the private random generator owned by one sensor.
+    
+    With NumPy this is a numpy.random.Generator (PCG64, a few hundred bytes
+    of state), otherwise a random.Random. Either way it never shares state
+    with other sensors or with the global random module.
+    
+    Args:
+        seed: int, numpy.random.SeedSequence or None for fresh entropy
+        
+    Returns:
+        numpy.random.Generator, or random.Random without NumPy
+    """
+    if np is None:
+        return random.Random(seed)
+    return np.random.default_rng(seed)
+
+
+def _randint(rng, low: int, high: int) -> int:
+    """Draw one integer in [low, high] from a generator made by _make_generator()."""
+    if np is None:
+        return rng.randint(low, high)
+    return int(rng.integers(low, high, endpoint=True))
+
+
+def _seed_uniform(seed: int, low: float, high: float) -> float:
+    """
+    Derive one value in [low, high) directly from an int seed.
+    
+    The value comes from a hash of the seed, so a one-off draw such as a
+    calibration offset does not need a generator of its own.
+    """
+    digest = hashlib.blake2b(str(seed).encode(), digest_size=8, person=b"seed_uniform").digest()
+    return low + (high - low) * int.from_bytes(digest, 'little') / 2**64
 
 
-class IRSensor:
+class IRSensorBase:
     """
     Complete implementation of the IR Sensor class from Session 4 hands-on exercise.
     
     This class simulates an infrared distance sensor commonly found on robots
-    like the e-puck.
+    like the e-puck. Use IRSensor, or SlottedIRSensor from slotted_classes.py.
     """
     
-    def __init__(self, name: str):
+    __slots__ = ()
+    
+    def __init__(self, name: str, seed=None):
         """
         Initialize the IR sensor with a position name.
         
         Args:
             name (str): The position/name of the sensor (e.g., "Front Left")
+            seed: Seed for this sensor's own random generator, e.g. from
+                spawn_seeds() (default: fresh entropy)
         """
         self.name = name
-        self.calibration_offset = random.uniform(-2, 2)  # Simulate sensor variance
+        self._seed = _resolve_seed(seed)
+        self._rng = None  # Created on the first reading, see _generator()
+        self.calibration_offset = _seed_uniform(self._seed, -2, 2)  # Simulate sensor variance
         print(f"IR Sensor '{self.name}' initialized")
     
+    def _generator(self):
+        """
+        Returns this sensor's random generator, creating it on first use.
+        
+        Sensors that are only read through an EPuckRobot sensor bank never
+        need one.
+        """
+        if self._rng is None:
+            self._rng = _make_generator(self._seed)
+        return self._rng
+    
     def get_reading(self) -> int:
         """
         Simulate getting a distance measurement from the IR sensor.
@@ -40,10 +160,10 @@ class IRSensor:
             int: Distance measurement in centimeters (1–100).
         """
         # Simulate reading with some calibration offset
-        base_reading = random.randint(1, 100)
+        base_reading = _randint(self._generator(), 1, 100)
         adjusted_reading = max(1, min(100, int(base_reading + self.calibration_offset)))
         
-        print(f"{self.name} sensor reading: {adjusted_reading} cm")
+        logger.info("%s sensor reading: %d cm", self.name, adjusted_reading)
         return adjusted_reading
     
     def calibrate(self, reference_distance: int):
@@ -53,30 +173,68 @@ class IRSensor:
         Args:
             reference_distance (int): Known distance in cm for calibration
         """
-        current_reading = random.randint(1, 100)  # Simulate current reading
+        current_reading = _randint(self._generator(), 1, 100)  # Simulate current reading
         self.calibration_offset = reference_distance - current_reading
         print(f"Sensor '{self.name}' calibrated. Offset: {self.calibration_offset:.2f}")
 
 
-class Lidar:
+class IRSensor(IRSensorBase):
+    """IR sensor that stores its attributes in an instance __dict__."""
+
+
+class LidarBase:
     """
     Complete implementation of the LIDAR class from Session 4 live demonstration.
     
     This class simulates a LIDAR sensor with configurable parameters for
-    robotics applications.
+    robotics applications. Use Lidar, or SlottedLidar from slotted_classes.py.
     """
     
-    def __init__(self, num_measurements: int = 36):
+    __slots__ = ()
+    
+    # Readings are stored as unsigned 16-bit integers (array('H') / numpy.uint16)
+    SCAN_ITEMSIZE = 2
+    
+    # Most floats scan_many() works on at once; larger batches are done in blocks
+    SCAN_SCRATCH_SIZE = 8192
+    
+    def __init__(self, num_measurements: int = 36, angular_resolution: float = None,
+                 seed=None):
         """
         Initialize LIDAR with specified number of measurements.
         
         Args:
             num_measurements (int): Number of measurements per scan (default: 36)
+            angular_resolution (float): Degrees between measurements; if given,
+                overrides num_measurements (e.g. 0.1 gives 3600 points)
+            seed: Seed for this sensor's own random generator, e.g. from
+                spawn_seeds() (default: fresh entropy)
+        
+        Raises:
+            ValueError: If angular_resolution is not positive or does not
+                divide 360° into a whole number of measurements
         """
+        if angular_resolution is not None:
+            if angular_resolution <= 0:
+                raise ValueError(f"angular_resolution must be positive, got {angular_resolution}")
+            beams = 360 / angular_resolution
+            if not math.isclose(beams, round(beams)):
+                raise ValueError(f"angular_resolution must divide 360° evenly, "
+                                 f"got {angular_resolution}")
+            num_measurements = round(beams)
         self.num_measurements = num_measurements
         self.min_range = 1      # Minimum detection range in cm
         self.max_range = 1200   # Maximum detection range in cm
         self.scan_count = 0     # Track number of scans performed
+        self.partial_scan_count = 0  # Track sector-only scans separately
+        self.overrun_count = 0  # Scan periods missed while streaming
+        
+        # Per-instance generator, shared by the pure-Python and NumPy scan paths
+        self._rng = _make_generator(seed)
+        self._angle_factors = None  # Per-beam angle modulation table
+        self._sector_buffer = None  # Reused by scan_filtered(reuse_buffer=True)
+        self._beam_trig = None      # (cos, sin) of every beam angle, for to_points()
+        self._scan_scratch = None   # Float rows reused by scan_many()
         
         print(f"LIDAR initialized with {self.num_measurements} measurement points")
 
@@ -88,15 +246,139 @@ class Lidar:
             int: Distance measurement in centimeters
         """
         # Simulate realistic LIDAR behavior with some noise
-        return random.randint(self.min_range, self.max_range)
+        return _randint(self._rng, self.min_range, self.max_range)
 
+    def _angle_table(self):
+        """
+        Returns the per-beam angle modulation sin(i * 2π / n) * 50.
+        
+        The table is built once and only rebuilt if num_measurements changes.
+        
+        Returns:
+            numpy.ndarray: One float offset per measurement point
+        """
+        if self._angle_factors is None or len(self._angle_factors) != self.num_measurements:
+            angles = np.arange(self.num_measurements) * 2 * math.pi / self.num_measurements
+            self._angle_factors = np.sin(angles) * 50
+        return self._angle_factors
+    
+    @property
+    def angular_resolution(self) -> float:
+        """Degrees between neighbouring measurements."""
+        return 360 / self.num_measurements
+    
+    @property
+    def scan_bytes(self) -> int:
+        """Memory used by one compact scan, in bytes."""
+        return self.num_measurements * self.SCAN_ITEMSIZE
+    
+    def scan_array(self):
+        """
+        Performs a full scan with NumPy and returns the readings as an array.
+        
+        All measurements are drawn in one generator call, the angle
+        modulation comes from a precomputed table and clamping is done with
+        np.clip, so there is no per-measurement Python loop.
+        
+        Returns:
+            numpy.ndarray: uint16 distance measurements in centimeters
+        """
+        _require_numpy("Lidar.scan_array()")
+        return self.scan_many(1)[0]
+    
+    def scan_compact(self) -> array:
+        """
+        Performs a full scan and returns it as a compact array('H').
+        
+        This stores 2 bytes per reading instead of a list of Python ints
+        (about 36 bytes each), and works with or without NumPy.
+        
+        Returns:
+            array: Unsigned 16-bit distance measurements in centimeters
+        """
+        if self._use_numpy():
+            readings = array('H')
+            readings.frombytes(self.scan_array().tobytes())
+            return readings
+        return array('H', self.scan())
+    
+    def scan_many(self, k: int, out=None):
+        """
+        Performs k full scans in one shot and returns them as a 2-D array.
+        
+        Uses the same angle modulation and range limits as scan(), but draws
+        the values for many scans per generator call and updates scan_count
+        once. The work is done in a small reusable float buffer, at most
+        SCAN_SCRATCH_SIZE values at a time, so with `out` no memory is
+        allocated that grows with k.
+        
+        Args:
+            k (int): Number of scans to generate
+            out (numpy.ndarray): Optional uint16 array of shape
+                (k, num_measurements) to fill instead of allocating a new one
+            
+        Returns:
+            numpy.ndarray: uint16 array of shape (k, num_measurements),
+            one scan per row
+        """
+        _require_numpy("Lidar.scan_many()")
+        
+        angle_factors = self._angle_table()
+        shape = (k, len(angle_factors))
+        if out is None:
+            out = np.empty(shape, dtype=np.uint16)
+        elif out.shape != shape or out.dtype != np.uint16:
+            raise ValueError(f"out must be a uint16 array of shape {shape}, "
+                             f"got {out.dtype} {out.shape}")
+        
+        scratch = self._scratch_rows(k)
+        span = self.max_range - self.min_range + 1
+        for first in range(0, k, len(scratch)):
+            rows = scratch[:min(len(scratch), k - first)]
+            # Uniform integers min_range..max_range, drawn in place as floats
+            self._rng.random(out=rows)
+            rows *= span
+            np.floor(rows, out=rows)
+            rows += self.min_range
+            rows += angle_factors  # Broadcasts the table over every row
+            # Clamping before the cast gives the same result as int() then clamp
+            np.clip(rows, self.min_range, self.max_range, out=rows)
+            np.copyto(out[first:first + len(rows)], rows, casting='unsafe')
+        
+        self.scan_count += k
+        return out
+    
+    def _scratch_rows(self, k: int):
+        """
+        Returns the float64 scratch rows used by scan_many().
+        
+        The buffer holds enough rows for k scans, up to SCAN_SCRATCH_SIZE
+        values, and is only reallocated when a call needs more rows.
+        """
+        rows = max(1, min(k, self.SCAN_SCRATCH_SIZE // self.num_measurements))
+        scratch = self._scan_scratch
+        if (scratch is None or scratch.shape[1] != self.num_measurements
+                or len(scratch) < rows):
+            scratch = self._scan_scratch = np.empty((rows, self.num_measurements))
+        return scratch
+    
+    def _use_numpy(self) -> bool:
+        """Returns True if the vectorized path matches get_measurement()."""
+        return np is not None and type(self).get_measurement is LidarBase.get_measurement
+    
     def scan(self) -> list:
         """
         Performs a full scan and returns a list of measurements.
         
+        When NumPy is available (and get_measurement has not been overridden)
+        this is a thin wrapper around scan_array().
+        
         Returns:
             list: List of distance measurements in centimeters
         """
+        if self._use_numpy():
+            return self.scan_array().tolist()
+        
         readings = []
         for i in range(self.num_measurements):
             # Add slight variation based on angle for realism
@@ -110,22 +392,245 @@ class Lidar:
         self.scan_count += 1
         return readings
     
-    def scan_filtered(self, start: int = 0, end: int = None) -> list:
+    def _sector_runs(self, start, end, degrees: bool) -> list:
         """
-        Return scan results between given indices.
+        Converts a sector into contiguous runs of measurement indices.
+        
+        Index sectors are half-open like slicing, [start, end). Degree
+        sectors include every beam whose angle lies in [start, end]. If start
+        is past end, the sector wraps around through index 0 (e.g. 350°→10°);
+        index sectors only wrap when both bounds lie within the scan.
+        
+        Returns:
+            list: One or two (first, stop) index pairs
+        """
+        n = self.num_measurements
+        if degrees:
+            start_angle = start % 360
+            end_angle = 360 if end is None or end >= 360 else end % 360
+            # Decide on the angles: both may round to the same beam gap
+            wraps = start_angle > end_angle
+            first = math.ceil(start_angle * n / 360)
+            stop = math.floor(end_angle * n / 360) + 1
+        else:
+            first = start + n if start < 0 else start
+            stop = n if end is None else (end + n if end < 0 else end)
+            # Only wrap between real indices; out-of-range bounds clamp like slicing
+            wraps = 0 <= stop < first <= n
+        first, stop = min(max(first, 0), n), min(max(stop, 0), n)
+        
+        if not wraps:
+            return [(first, max(first, stop))]
+        return [run for run in ((first, n), (0, stop)) if run[0] < run[1]] or [(0, 0)]
+    
+    def scan_filtered(self, start: float = 0, end: float = None,
+                      degrees: bool = False, reuse_buffer: bool = False):
+        """
+        Return scan results for a sector, generating only the requested points.
+        
+        This counts as a partial scan (partial_scan_count), not a full scan.
+        
+        Args:
+            start (float): Starting index, or angle if degrees is True (default: 0)
+            end (float): Ending index (exclusive), or angle (inclusive) if
+                degrees is True (default: end of the scan)
+            degrees (bool): Interpret start and end as angles in degrees
+            reuse_buffer (bool): Return a uint16 view over an internal buffer
+                instead of a new list; it is overwritten by the next call
+            
+        Returns:
+            list: Filtered scan results (numpy.ndarray if reuse_buffer is True)
+        """
+        runs = self._sector_runs(start, end, degrees)
+        count = sum(stop - first for first, stop in runs)
+        self.partial_scan_count += 1
+        
+        if reuse_buffer:
+            _require_numpy("Lidar.scan_filtered(reuse_buffer=True)")
+        
+        if not self._use_numpy():
+            readings = []
+            for first, stop in runs:
+                for i in range(first, stop):
+                    angle_factor = math.sin(i * 2 * math.pi / self.num_measurements) * 50
+                    readings.append(max(self.min_range,
+                                        min(self.max_range,
+                                            int(self.get_measurement() + angle_factor))))
+            return readings
+        
+        angle_factors = self._angle_table()
+        if len(runs) == 1:
+            sector_factors = angle_factors[runs[0][0]:runs[0][1]]
+        else:
+            sector_factors = np.concatenate([angle_factors[first:stop] for first, stop in runs])
+        
+        readings = self._rng.integers(self.min_range, self.max_range + 1, size=count)
+        readings = np.clip(readings + sector_factors, self.min_range, self.max_range)
+        
+        if not reuse_buffer:
+            return readings.astype(np.int64).tolist()
+        
+        if self._sector_buffer is None or len(self._sector_buffer) != self.num_measurements:
+            self._sector_buffer = np.empty(self.num_measurements, dtype=np.uint16)
+        view = self._sector_buffer[:count]
+        np.copyto(view, readings, casting='unsafe')
+        return view
+    
+    def _trig_table(self):
+        """
+        Returns the cosine and sine of every beam angle i * 2π / n.
+        
+        Like the angle modulation table, this is built once and only rebuilt
+        if num_measurements changes.
+        
+        Returns:
+            tuple: (cos, sin) float32 arrays with one entry per measurement point
+        """
+        if self._beam_trig is None or len(self._beam_trig[0]) != self.num_measurements:
+            angles = np.arange(self.num_measurements) * 2 * math.pi / self.num_measurements
+            self._beam_trig = (np.cos(angles).astype(np.float32),
+                               np.sin(angles).astype(np.float32))
+        return self._beam_trig
+    
+    def to_points(self, scan, pose=None, scale: float = 0.01):
+        """
+        Converts a scan, or a batch of scans, into 2-D Cartesian points.
+        
+        Beam i points at angle i * 2π / n, counter-clockwise from the robot's
+        forward (x) axis. Readings below min_range or at max_range (no
+        return) become NaN points, so the output shape never changes.
         
         Args:
-            start (int): Starting index (default: 0)
-            end (int): Ending index (default: num_measurements)
+            scan: Readings in cm, shape (num_measurements,) or
+                (k, num_measurements), e.g. from scan_array() or scan_many()
+            pose: Robot pose (x, y, phi) in meters and radians, as returned
+                by get_robot_pose(), or one pose per scan with shape (k, 3).
+                If omitted, points are in the robot frame.
+            scale (float): Factor from reading units to point units
+                (default: 0.01, cm to meters to match the pose)
             
         Returns:
-            list: Filtered scan results
+            numpy.ndarray: float32 points of shape (num_measurements, 2) or
+            (k, num_measurements, 2)
+        """
+        _require_numpy("Lidar.to_points()")
+        
+        readings = np.asarray(scan)
+        if readings.shape[-1] != self.num_measurements:
+            raise ValueError(f"scan must have {self.num_measurements} readings per row, "
+                             f"got shape {readings.shape}")
+        
+        cos, sin = self._trig_table()
+        ranges = readings.astype(np.float32) * np.float32(scale)
+        
+        if pose is not None:
+            pose = np.asarray(pose, dtype=np.float64)
+            heading = pose[..., 2:3]
+            cos_phi, sin_phi = np.cos(heading).astype(np.float32), np.sin(heading).astype(np.float32)
+            # Rotate every beam direction by the robot heading
+            cos, sin = cos * cos_phi - sin * sin_phi, sin * cos_phi + cos * sin_phi
+        
+        points = np.empty(readings.shape + (2,), dtype=np.float32)
+        np.multiply(ranges, cos, out=points[..., 0])
+        np.multiply(ranges, sin, out=points[..., 1])
+        if pose is not None:
+            points += pose[..., np.newaxis, :2].astype(np.float32)
+        
+        points[(readings < self.min_range) | (readings >= self.max_range)] = np.nan
+        return points
+    
+    def _stream_ring(self, rate_hz: float, buffer_scans: int):
+        """
+        Allocates the ring used by stream() and astream().
+        
+        Returns:
+            tuple: (ring, views, period) where views are read-only rows of ring
+        """
+        _require_numpy("Lidar.stream()")
+        if rate_hz <= 0 or buffer_scans < 1:
+            raise ValueError("rate_hz must be positive and buffer_scans at least 1")
+        
+        ring = np.empty((buffer_scans, self.num_measurements), dtype=np.uint16)
+        views = []
+        for slot in range(buffer_scans):
+            view = ring[slot].view()
+            view.flags.writeable = False
+            views.append(view)
+        return ring, views, 1.0 / rate_hz
+    
+    def _stream_wait(self, deadline: float, period: float):
+        """
+        Works out how long to wait for the next scan slot.
+        
+        If the consumer has fallen behind, whole missed periods are skipped
+        and added to overrun_count instead of producing a burst of late scans.
+        
+        Returns:
+            tuple: (seconds_to_sleep, deadline) for the scan about to be taken
+        """
+        now = time.monotonic()
+        if now <= deadline:
+            return deadline - now, deadline
+        
+        missed = int((now - deadline) // period)
+        self.overrun_count += missed
+        return 0.0, deadline + missed * period
+    
+    def stream(self, rate_hz: float, buffer_scans: int = 8, max_scans: int = None):
+        """
+        Yields scans at a fixed rate from a preallocated ring buffer.
+        
+        Each scan is written into the next slot of a (buffer_scans,
+        num_measurements) uint16 ring and yielded as a read-only view, so no
+        list is allocated per scan. A view is overwritten buffer_scans scans
+        later; copy it if you need to keep it longer. Periods missed because
+        the consumer was too slow are counted in overrun_count.
+        
+        Args:
+            rate_hz (float): Scan rate in scans per second
+            buffer_scans (int): Number of slots in the ring (default: 8)
+            max_scans (int): Stop after this many scans (default: run forever)
+            
+        Yields:
+            numpy.ndarray: Read-only uint16 view of the latest scan
+        """
+        ring, views, period = self._stream_ring(rate_hz, buffer_scans)
+        deadline = time.monotonic()
+        produced = 0
+        
+        while max_scans is None or produced < max_scans:
+            delay, deadline = self._stream_wait(deadline, period)
+            if delay:
+                time.sleep(delay)
+            
+            slot = produced % buffer_scans
+            self.scan_many(1, out=ring[slot:slot + 1])
+            yield views[slot]
+            
+            produced += 1
+            deadline += period
+    
+    async def astream(self, rate_hz: float, buffer_scans: int = 8, max_scans: int = None):
+        """
+        Asynchronous version of stream() for use with ``async for``.
+        
+        Waiting between scans uses asyncio.sleep, so other tasks keep running.
+        Arguments and yielded views are the same as for stream().
         """
-        if end is None:
-            end = self.num_measurements
+        ring, views, period = self._stream_ring(rate_hz, buffer_scans)
+        deadline = time.monotonic()
+        produced = 0
+        
+        while max_scans is None or produced < max_scans:
+            delay, deadline = self._stream_wait(deadline, period)
+            await asyncio.sleep(delay)
+            
+            slot = produced % buffer_scans
+            self.scan_many(1, out=ring[slot:slot + 1])
+            yield views[slot]
             
-        full_scan = self.scan()
-        return full_scan[start:end]
+            produced += 1
+            deadline += period
     
     def get_status(self) -> str:
         """
@@ -136,17 +641,36 @@ class Lidar:
         """
         return (f"LIDAR Status: {self.num_measurements} measurement points configured, "
                 f"{self.scan_count} scans completed, "
-                f"Range: {self.min_range}-{self.max_range} cm")
+                f"{self.partial_scan_count} partial scans, "
+                f"{self.overrun_count} overruns, "
+                f"Range: {self.min_range}-{self.max_range} cm, "
+                f"{self.angular_resolution:g}° resolution, "
+                f"{self.scan_bytes} bytes per scan")
+
+
+class Lidar(LidarBase):
+    """LIDAR sensor that stores its attributes in an instance __dict__."""
 
 
-class Robot:
+class RobotBase:
     """
     Complete implementation of the Robot class template.
     
     This class serves as a foundation for creating robot objects with
     common attributes and behaviors.
+    
+    get_status() and status_bytes() are cached. The cache is keyed on the
+    values they show, so it is rebuilt whenever one of them changes, whether
+    through a method or a direct assignment such as robot.battery_level = 85.
+    Use Robot, or SlottedRobot from slotted_classes.py.
     """
     
+    __slots__ = ()
+    
+    # Binary status snapshot: robot_id (UTF-8, padded/truncated to 16 bytes),
+    # position_x, position_y, battery_level, total_distance, is_moving
+    STATUS_STRUCT = struct.Struct("<16sdddd?")
+    
     def __init__(self, robot_id: str, initial_battery: float):
         """
         Initialize a new Robot object.
@@ -161,6 +685,8 @@ class Robot:
         self.position_y = 0
         self.is_moving = False
         self.total_distance = 0.0
+        self._status_cache = None        # (state key, status string)
+        self._status_bytes_cache = None  # (state key, packed status)
         
         print(f"Robot '{self.robot_id}' initialized with {self.battery_level}% battery")
     
@@ -194,20 +720,94 @@ class Robot:
         
         print(f"Robot {self.robot_id}: Arrived at ({x}, {y}). Battery: {self.battery_level:.1f}%")
     
+    def _status_key(self) -> tuple:
+        """
+        Returns the state shown by get_status() and status_bytes().
+        
+        The cached status is reused only while this key is unchanged. Types
+        are included where they change the output (5 and 5.0 print differently).
+        """
+        return (self.robot_id, self.position_x, type(self.position_x),
+                self.position_y, type(self.position_y), self.battery_level,
+                self.is_moving, type(self.is_moving), self.total_distance)
+    
+    def _status_lines(self) -> list:
+        """
+        Build the lines of the status report, without the closing line.
+        
+        Returns:
+            list: Status lines
+        """
+        return [
+            f"=== Robot {self.robot_id} Status ===",
+            f"Position: ({self.position_x}, {self.position_y})",
+            f"Battery: {self.battery_level:.1f}%",
+            f"Moving: {self.is_moving}",
+            f"Total Distance: {self.total_distance:.1f} units",
+        ]
+    
     def get_status(self) -> str:
         """
         Get current robot status information.
         
+        The string is only rebuilt after the robot's state has changed.
+        
         Returns:
             str: Formatted status string
         """
-        status = f"=== Robot {self.robot_id} Status ===\n"
-        status += f"Position: ({self.position_x}, {self.position_y})\n"
-        status += f"Battery: {self.battery_level:.1f}%\n"
-        status += f"Moving: {self.is_moving}\n"
-        status += f"Total Distance: {self.total_distance:.1f} units\n"
-        status += "=" * (len(f"Robot {self.robot_id} Status") + 6)
-        return status
+        key = self._status_key()
+        if self._status_cache is None or self._status_cache[0] != key:
+            lines = self._status_lines()
+            lines.append("=" * (len(f"Robot {self.robot_id} Status") + 6))
+            self._status_cache = (key, "\n".join(lines))
+        return self._status_cache[1]
+    
+    def status_dict(self) -> dict:
+        """
+        Get the robot's status as a dictionary, for programs rather than people.
+        
+        Returns:
+            dict: Status values keyed by attribute name
+        """
+        return {
+            "robot_id": self.robot_id,
+            "position_x": self.position_x,
+            "position_y": self.position_y,
+            "battery_level": self.battery_level,
+            "total_distance": self.total_distance,
+            "is_moving": self.is_moving,
+        }
+    
+    def _status_fields(self) -> tuple:
+        """Values packed by status_bytes(), in STATUS_STRUCT order."""
+        return (self.robot_id.encode("utf-8"), self.position_x, self.position_y,
+                self.battery_level, self.total_distance, self.is_moving)
+    
+    def status_bytes(self) -> bytes:
+        """
+        Get a fixed-size binary status snapshot (see STATUS_STRUCT).
+        
+        Returns:
+            bytes: Packed status, cached like get_status()
+        """
+        key = self._status_key()
+        if self._status_bytes_cache is None or self._status_bytes_cache[0] != key:
+            self._status_bytes_cache = (key, self.STATUS_STRUCT.pack(*self._status_fields()))
+        return self._status_bytes_cache[1]
+    
+    @classmethod
+    def unpack_status(cls, data: bytes) -> tuple:
+        """
+        Unpack a snapshot made by status_bytes().
+        
+        Args:
+            data (bytes): Snapshot from status_bytes() of an instance of this class
+            
+        Returns:
+            tuple: Values in STATUS_STRUCT order, robot_id decoded to str
+        """
+        values = cls.STATUS_STRUCT.unpack(data)
+        return (values[0].rstrip(b"\0").decode("utf-8", "ignore"),) + values[1:]
     
     def charge_battery(self, amount: float):
         """
@@ -233,60 +833,155 @@ class Robot:
         return math.sqrt(self.position_x**2 + self.position_y**2)
 
 
-class EPuckRobot(Robot):
+class Robot(RobotBase):
+    """Robot that stores its attributes in an instance __dict__."""
+
+
+class EPuckRobotBase(RobotBase):
     """
     E-puck robot specific implementation.
     
     Extends the base Robot class with e-puck specific features like
-    LED control and sensor management.
+    LED control and sensor management. Use EPuckRobot, or SlottedEPuckRobot
+    from slotted_classes.py.
     """
     
-    def __init__(self, robot_id: str, initial_battery: float):
+    __slots__ = ()
+    
+    # Robot snapshot followed by the LED bitmask and left/right wheel speeds
+    STATUS_STRUCT = struct.Struct(RobotBase.STATUS_STRUCT.format + "Bdd")
+    
+    # Sensor bank readings are drawn from the generator this many at a time
+    BANK_BLOCK = 256
+    
+    SENSOR_POSITIONS = [
+        "Front Right", "Front Right Side", "Right Side", "Back Right",
+        "Back Left", "Left Side", "Front Left Side", "Front Left"
+    ]
+    sensor_class = IRSensor  # Class used for the proximity sensors
+    
+    def __init__(self, robot_id: str, initial_battery: float, seed=None):
         """
         Initialize an E-puck robot.
         
         Args:
             robot_id (str): Unique identifier for the robot
             initial_battery (float): Starting battery level (0.0-100.0)
+            seed: Seed from which each proximity sensor's seed and the sensor
+                bank's seed are derived (default: fresh entropy)
         """
         super().__init__(robot_id, initial_battery)
         
+        # One seed per sensor, then one for the sensor bank
+        sensor_count = len(self.SENSOR_POSITIONS)
+        seeds = spawn_seeds(seed, sensor_count + 1)
+        
         # E-puck specific attributes
         self.led_states = [False] * 8  # 8 LEDs on e-puck
-        self.sensors = self._initialize_sensors()
+        self.sensors = self._initialize_sensors(seeds[:sensor_count])
         self.wheel_speeds = {"left": 0.0, "right": 0.0}
+        self._init_sensor_bank(seeds[sensor_count])
         
         print(f"E-puck robot '{self.robot_id}' ready with {len(self.sensors)} sensors")
     
-    def _initialize_sensors(self) -> list:
+    def _initialize_sensors(self, seeds) -> list:
         """
         Initialize the proximity sensors for the e-puck.
         
+        Args:
+            seeds (list): One seed per entry in SENSOR_POSITIONS
+        
         Returns:
             list: List of IRSensor objects
         """
-        sensor_positions = [
-            "Front Right", "Front Right Side", "Right Side", "Back Right",
-            "Back Left", "Left Side", "Front Left Side", "Front Left"
-        ]
-        return [IRSensor(position) for position in sensor_positions]
+        return [self.sensor_class(position, seed=sensor_seed)
+                for position, sensor_seed in zip(self.SENSOR_POSITIONS, seeds)]
+    
+    def _init_sensor_bank(self, seed):
+        """
+        Set up the sensor bank so all proximity sensors can be read in one call.
+        
+        The bank's generator and arrays are only created on the first read.
+        Does nothing without NumPy; read_sensors() then reads each sensor in
+        turn.
+        
+        Args:
+            seed: Seed for the bank's own generator
+        """
+        if np is None:
+            return
+        self._bank_seed = seed
+        self._bank_rng = None  # Generator, made on the first read
+        self._bank_draws = None  # Raw readings, BANK_BLOCK rows of one per sensor
+        self._bank_next = self.BANK_BLOCK  # Row of _bank_draws to use next
+        self._bank_values = None  # Float and int work arrays, made on the first read
+        self._bank_readings = None
+    
+    def read_sensor_bank(self):
+        """
+        Read all proximity sensors at once into a preallocated array.
+        
+        Raw readings are drawn BANK_BLOCK reads at a time, and each sensor's
+        current calibration offset is applied in a single array add. The
+        returned array is reused and overwritten by the next call; copy it
+        to keep it.
+        
+        Returns:
+            numpy.ndarray: One reading in cm (1-100) per sensor
+        """
+        _require_numpy("EPuckRobot.read_sensor_bank()")
+        count = len(self.sensors)
+        if self._bank_readings is None:
+            self._bank_rng = _make_generator(self._bank_seed)
+            self._bank_values = np.empty(count)
+            self._bank_readings = np.empty(count, dtype=np.int64)
+        if self._bank_next == self.BANK_BLOCK:
+            self._bank_draws = self._bank_rng.integers(1, 101, size=(self.BANK_BLOCK, count),
+                                                       dtype=np.uint8)
+            self._bank_next = 0
+        row = self._bank_draws[self._bank_next]
+        self._bank_next += 1
+        
+        # Offsets are read from the sensors every time, so calibrate() applies at once
+        values = self._bank_values
+        values[:] = [sensor.calibration_offset for sensor in self.sensors]
+        values += row
+        # Clamp, then truncate on the integer copy; same result as IRSensor.get_reading()
+        np.maximum(values, 1, out=values)
+        np.minimum(values, 100, out=values)
+        self._bank_readings[:] = values
+        return self._bank_readings
     
     def read_sensors(self) -> list:
         """
         Read proximity sensor values.
         
+        Uses the sensor bank when NumPy is available, otherwise reads each
+        IRSensor in turn. Sensors whose class overrides get_reading() are
+        always read one by one, since the bank would bypass them.
+        
+        The bank draws from its own generator rather than the sensors', so
+        the same seed gives different readings with and without NumPy.
+        
         Returns:
             list: List of sensor readings
         """
-        readings = []
-        print(f"Robot {self.robot_id}: Reading proximity sensors...")
-        
-        for i, sensor in enumerate(self.sensors):
-            reading = sensor.get_reading()
-            readings.append(reading)
+        if not self._uses_sensor_bank():
+            logger.info("Robot %s: Reading proximity sensors...", self.robot_id)
+            return [sensor.get_reading() for sensor in self.sensors]
         
+        readings = self.read_sensor_bank().tolist()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Robot %s: Reading proximity sensors...", self.robot_id)
+            for sensor, reading in zip(self.sensors, readings):
+                logger.info("%s sensor reading: %d cm", sensor.name, reading)
         return readings
     
+    def _uses_sensor_bank(self) -> bool:
+        """Returns True if read_sensors() can use read_sensor_bank()."""
+        return np is not None and all(type(sensor).get_reading is IRSensorBase.get_reading
+                                      for sensor in self.sensors)
+    
     def set_led_state(self, led_id: int, state: bool):
         """
         Control individual LEDs on the e-puck.
@@ -331,26 +1026,48 @@ class EPuckRobot(Robot):
         print(f"Robot {self.robot_id}: Wheel speeds set - "
               f"Left: {self.wheel_speeds['left']:.2f}, Right: {self.wheel_speeds['right']:.2f}")
     
-    def get_status(self) -> str:
+    def _status_key(self) -> tuple:
+        """Returns the Robot status key plus the e-puck state shown in the status."""
+        return super()._status_key() + (tuple(self.led_states), self.wheel_speeds["left"],
+                                        self.wheel_speeds["right"], len(self.sensors))
+    
+    def _status_lines(self) -> list:
         """
-        Get comprehensive status including e-puck specific information.
+        Build the status lines, adding e-puck information after the Robot lines.
         
         Returns:
-            str: Detailed status string
+            list: Status lines, without the closing line
         """
-        base_status = super().get_status()
-        
-        # Add e-puck specific status
         led_status = "".join(["●" if led else "○" for led in self.led_states])
-        epuck_info = f"\nLED States: {led_status}\n"
-        epuck_info += f"Wheel Speeds: L={self.wheel_speeds['left']:.2f}, R={self.wheel_speeds['right']:.2f}\n"
-        epuck_info += f"Sensors: {len(self.sensors)} proximity sensors available"
-        
-        # Insert e-puck info before the closing line
-        status_lines = base_status.split('\n')
-        status_lines.insert(-1, epuck_info)
+        return super()._status_lines() + [
+            "",
+            f"LED States: {led_status}",
+            f"Wheel Speeds: L={self.wheel_speeds['left']:.2f}, R={self.wheel_speeds['right']:.2f}",
+            f"Sensors: {len(self.sensors)} proximity sensors available",
+        ]
+    
+    def status_dict(self) -> dict:
+        """
+        Get the e-puck's status as a dictionary, for programs rather than people.
         
-        return '\n'.join(status_lines)
+        Returns:
+            dict: Robot status plus LED states, wheel speeds and sensor count
+        """
+        status = super().status_dict()
+        status["led_states"] = list(self.led_states)
+        status["wheel_speeds"] = dict(self.wheel_speeds)
+        status["sensor_count"] = len(self.sensors)
+        return status
+    
+    def _status_fields(self) -> tuple:
+        """Values packed by status_bytes(), in STATUS_STRUCT order."""
+        leds = sum(1 << led for led, state in enumerate(self.led_states) if state)
+        return super()._status_fields() + (leds, self.wheel_speeds["left"],
+                                           self.wheel_speeds["right"])
+
+
+class EPuckRobot(EPuckRobotBase, Robot):
+    """E-puck robot that stores its attributes in an instance __dict__."""
 
 
 def demonstrate_all_classes():
@@ -386,6 +1103,38 @@ def demonstrate_all_classes():
     front_arc = lidar.scan_filtered(2, 8)
     print(f"Front arc readings: {front_arc}")
     
+    # Wrap-around sector given in degrees: 330° through 30°
+    forward_sector = lidar.scan_filtered(330, 30, degrees=True)
+    print(f"Forward sector (330°-30°): {forward_sector}")
+    
+    if np is not None:
+        # High-resolution scan using the vectorized NumPy path
+        hires_lidar = Lidar(angular_resolution=0.1)
+        hires_readings = hires_lidar.scan_array()
+        print(f"3600-point scan: min={hires_readings.min()} cm, max={hires_readings.max()} cm")
+        print(hires_lidar.get_status())
+        
+        # Seeded sensors reproduce the same scans bit-for-bit
+        fleet_seeds = spawn_seeds(2024, 2)
+        first_run = Lidar(12, seed=fleet_seeds[0]).scan()
+        second_run = Lidar(12, seed=fleet_seeds[0]).scan()
+        print(f"Same seed, same scan: {first_run == second_run}")
+        
+        # Point cloud in the world frame, robot at (1 m, 0.5 m) facing +y
+        points = lidar.to_points(lidar.scan_array(), pose=(1.0, 0.5, math.pi / 2))
+        valid = np.count_nonzero(~np.isnan(points[:, 0]))
+        print(f"Point cloud: {valid} valid points, first at "
+              f"({points[0, 0]:.2f} m, {points[0, 1]:.2f} m)")
+        
+        # Batch of scans generated in one call
+        batch = lidar.scan_many(100)
+        print(f"Batch of {batch.shape[0]} scans: shape={batch.shape}, dtype={batch.dtype}")
+        
+        # Stream scans at 50 Hz, as an obstacle detector would consume them
+        for streamed_scan in lidar.stream(50, buffer_scans=4, max_scans=5):
+            print(f"Streamed scan: closest obstacle {streamed_scan.min()} cm")
+        print(lidar.get_status())
+    
     print("\n" + "-" * 50)
     
     # 3. Demonstrate Robot classes
@@ -420,7 +1169,11 @@ def demonstrate_all_classes():
     
     print("\nFinal E-puck status:")
     print(epuck.get_status())
+    print(f"Status snapshot: {len(epuck.status_bytes())} bytes, "
+          f"battery {epuck.status_dict()['battery_level']:.1f}%")
 
 
 if __name__ == "__main__":
+    # Show sensor readings in the demo; controllers leave logging at WARNING
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     demonstrate_all_classes()
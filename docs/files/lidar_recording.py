@@ -0,0 +1,342 @@
+"""
+LIDAR Scan Recording and Replay
+ICTPRG430 - Week 4 Extension: Recording and Replaying Sensor Data
+
+Records Lidar scans to a fixed-record binary file and replays them through
+a memory map, so large logs can be processed without loading them into RAM.
+
+File layout (little-endian):
+    Header (32 bytes): magic b"LIDARREC", format version (uint16),
+        num_measurements (uint32), min_range and max_range (uint16, cm),
+        then zero padding
+    Records: timestamp (float64, seconds) followed by num_measurements
+        readings (uint16, cm), repeated until the end of the file
+"""
+
+import os
+import struct
+import time
+
+import numpy as np
+
+from class_implementation_examples import Lidar
+
+MAGIC = b"LIDARREC"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHIHH")
+HEADER_SIZE = 32
+
+
+def record_dtype(num_measurements: int) -> np.dtype:
+    """
+    Returns the structured dtype of one record in a scan file.
+
+    Args:
+        num_measurements (int): Readings per scan
+
+    Returns:
+        numpy.dtype: Fields 'timestamp' (float64) and 'scan' (uint16[num_measurements])
+    """
+    return np.dtype([('timestamp', '<f8'), ('scan', '<u2', (num_measurements,))])
+
+
+def read_header(path) -> dict:
+    """
+    Reads and validates the header of a scan file.
+
+    Args:
+        path (str): Scan file path
+
+    Returns:
+        dict: num_measurements, min_range and max_range
+    """
+    with open(path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+
+    if len(header) < HEADER_SIZE:
+        raise ValueError(f"{path}: file too short for a scan header")
+    magic, version, num_measurements, min_range, max_range = HEADER.unpack_from(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a LIDAR scan file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported format version {version}")
+
+    return {'num_measurements': num_measurements, 'min_range': min_range, 'max_range': max_range}
+
+
+class ScanRecorder:
+    """
+    Appends timestamped scans to a binary scan file.
+
+    Use as a context manager so the file is always closed:
+
+        with ScanRecorder("run.lidar", lidar) as recorder:
+            recorder.record(lidar.scan_array())
+    """
+
+    def __init__(self, path, lidar: Lidar):
+        """
+        Open a scan file for appending, creating it if needed.
+
+        Args:
+            path (str): Scan file path
+            lidar (Lidar): Sensor whose num_measurements and range are recorded
+        """
+        self.path = path
+        self.num_measurements = lidar.num_measurements
+        self.dtype = record_dtype(lidar.num_measurements)
+        self.records_written = 0
+
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            header = read_header(path)
+            expected = {'num_measurements': lidar.num_measurements,
+                        'min_range': lidar.min_range, 'max_range': lidar.max_range}
+            if header != expected:
+                raise ValueError(f"{path}: recorded with {header}, cannot append {expected}")
+            self._file = open(path, 'r+b')
+            # Drop a partial record left by an interrupted recording before appending
+            records = (os.path.getsize(path) - HEADER_SIZE) // self.dtype.itemsize
+            self._file.truncate(HEADER_SIZE + records * self.dtype.itemsize)
+            self._file.seek(0, os.SEEK_END)
+        else:
+            self._file = open(path, 'wb')
+            header = HEADER.pack(MAGIC, FORMAT_VERSION, lidar.num_measurements,
+                                 lidar.min_range, lidar.max_range)
+            self._file.write(header.ljust(HEADER_SIZE, b"\0"))
+
+    def record(self, scan, timestamp: float = None):
+        """
+        Appends one scan.
+
+        Args:
+            scan: Readings for one scan (list, array('H') or numpy array)
+            timestamp (float): Time of the scan in seconds (default: time.time())
+        """
+        self.record_many(np.asarray(scan)[np.newaxis],
+                         [time.time() if timestamp is None else timestamp])
+
+    def record_many(self, scans, timestamps=None):
+        """
+        Appends a batch of scans in a single write.
+
+        Args:
+            scans: Array of shape (k, num_measurements), e.g. from Lidar.scan_many()
+            timestamps: k timestamps in seconds (default: time.time() for all)
+        """
+        scans = np.asarray(scans)
+        if scans.ndim != 2 or scans.shape[1] != self.num_measurements:
+            raise ValueError(f"scans must have shape (k, {self.num_measurements}), got {scans.shape}")
+
+        records = np.empty(len(scans), dtype=self.dtype)
+        records['timestamp'] = time.time() if timestamps is None else timestamps
+        records['scan'] = scans
+        self._file.write(records.tobytes())
+        self.records_written += len(records)
+
+    def close(self):
+        """Flushes and closes the scan file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ScanLog:
+    """
+    Read-only, memory-mapped view of a scan file.
+
+    Indexing and slicing return views into the mapping, so nothing is copied
+    until the data is actually used.
+    """
+
+    def __init__(self, path):
+        """
+        Map a scan file into memory.
+
+        Args:
+            path (str): Scan file path
+        """
+        header = read_header(path)
+        self.path = path
+        self.num_measurements = header['num_measurements']
+        self.min_range = header['min_range']
+        self.max_range = header['max_range']
+
+        dtype = record_dtype(self.num_measurements)
+        # Ignore a trailing partial record left by an interrupted recording
+        count = (os.path.getsize(path) - HEADER_SIZE) // dtype.itemsize
+        if count:
+            self.records = np.memmap(path, dtype=dtype, mode='r',
+                                     offset=HEADER_SIZE, shape=(count,))
+        else:
+            self.records = np.empty(0, dtype=dtype)
+
+    @property
+    def timestamps(self):
+        """numpy.ndarray: Timestamp of every record, in seconds."""
+        return self.records['timestamp']
+
+    @property
+    def scans(self):
+        """numpy.ndarray: All readings as a (len(log), num_measurements) uint16 view."""
+        return self.records['scan']
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index):
+        """Returns one scan or a slice of scans as a view into the file."""
+        return self.records['scan'][index]
+
+
+class ReplayLidar(Lidar):
+    """
+    Lidar that serves recorded scans instead of simulating them.
+
+    Every scan method (scan, scan_array, scan_compact, scan_many,
+    scan_filtered and stream) reads the next records from a ScanLog, so
+    existing consumers work unchanged on recorded data.
+    """
+
+    def __init__(self, path, loop: bool = False):
+        """
+        Initialize a replay source.
+
+        Args:
+            path (str): Scan file path
+            loop (bool): Restart from the first record at the end of the log
+        """
+        self.log = ScanLog(path)
+        if not len(self.log):
+            raise ValueError(f"{path}: scan file contains no records")
+        super().__init__(self.log.num_measurements)
+        self.min_range = self.log.min_range
+        self.max_range = self.log.max_range
+        self.loop = loop
+        self.position = 0          # Index of the next record to replay
+        self.last_timestamp = None  # Timestamp of the most recently replayed scan
+        self._beam_scan = None     # Scan that get_measurement() is stepping through
+        self._beam_index = 0
+
+    def _next_records(self, k: int):
+        """
+        Returns the next k records and advances the replay position.
+
+        Raises:
+            EOFError: If fewer than k records remain and loop is False
+        """
+        end = self.position + k
+        if end <= len(self.log):
+            records = self.log.records[self.position:end]
+        elif self.loop:
+            indices = np.arange(self.position, end) % len(self.log)
+            records = self.log.records[indices]
+        else:
+            raise EOFError(f"{self.log.path}: {len(self.log) - self.position} scans left, "
+                           f"{k} requested")
+
+        self.position = end % len(self.log) if self.loop else end
+        self.last_timestamp = float(records['timestamp'][-1])
+        return records
+
+    def get_measurement(self) -> int:
+        """
+        Returns the next recorded beam.
+
+        Beams are served in order from one recorded scan; the next record is
+        replayed once all of its beams have been returned.
+
+        Returns:
+            int: Distance measurement in centimeters
+        """
+        if self._beam_scan is None or self._beam_index == self.num_measurements:
+            self._beam_scan = self._next_records(1)['scan'][0]
+            self._beam_index = 0
+        reading = int(self._beam_scan[self._beam_index])
+        self._beam_index += 1
+        return reading
+
+    def _use_numpy(self) -> bool:
+        """Returns True: scans replay the same records as get_measurement()."""
+        return True
+
+    def scan_many(self, k: int, out=None):
+        """
+        Returns the next k recorded scans.
+
+        Args:
+            k (int): Number of scans to replay
+            out (numpy.ndarray): Optional uint16 array of shape
+                (k, num_measurements) to copy into
+
+        Returns:
+            numpy.ndarray: Read-only view into the recording (or out if given)
+        """
+        scans = self._next_records(k)['scan']
+        if out is not None:
+            if out.shape != scans.shape or out.dtype != np.uint16:
+                raise ValueError(f"out must be a uint16 array of shape {scans.shape}, "
+                                 f"got {out.dtype} {out.shape}")
+            np.copyto(out, scans)
+            scans = out
+
+        self.scan_count += k
+        return scans
+
+    def scan_filtered(self, start: float = 0, end: float = None,
+                      degrees: bool = False, reuse_buffer: bool = False):
+        """
+        Returns a sector of the next recorded scan.
+
+        Arguments are the same as Lidar.scan_filtered(); with reuse_buffer the
+        result is a uint16 array (a view into the recording where possible).
+        """
+        scan = self._next_records(1)['scan'][0]
+        self.partial_scan_count += 1
+
+        sector = np.concatenate([scan[first:stop]
+                                 for first, stop in self._sector_runs(start, end, degrees)])
+        return sector if reuse_buffer else sector.tolist()
+
+    def get_status(self) -> str:
+        """
+        Returns the current status, including the replay position.
+
+        Returns:
+            str: Status information string
+        """
+        return (f"{super().get_status()}, "
+                f"replaying {self.log.path} ({self.position}/{len(self.log)} scans)")
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    print("=== LIDAR Recording and Replay ===\n")
+
+    lidar = Lidar(angular_resolution=1)
+    log_path = os.path.join(tempfile.mkdtemp(), "demo.lidar")
+
+    # Record 1000 scans in one batch, then a few single scans
+    with ScanRecorder(log_path, lidar) as recorder:
+        recorder.record_many(lidar.scan_many(1000),
+                             timestamps=np.arange(1000) * 0.1)
+        for _ in range(5):
+            recorder.record(lidar.scan_array())
+    print(f"Recorded {recorder.records_written} scans to {log_path} "
+          f"({os.path.getsize(log_path) / 1024:.0f} KB)")
+
+    # Analyse the whole log through the memory map
+    log = ScanLog(log_path)
+    print(f"Log holds {len(log)} scans of {log.num_measurements} points")
+    print(f"Closest obstacle per scan (first 5): {log.scans.min(axis=1)[:5].tolist()}")
+
+    # Replay as a drop-in Lidar
+    replay = ReplayLidar(log_path)
+    first_scan = replay.scan()
+    print(f"Replayed scan: {first_scan[:5]}... at t={replay.last_timestamp:.1f} s")
+    print(f"Front sector (350°-10°): {replay.scan_filtered(350, 10, degrees=True)}")
+    print(replay.get_status())
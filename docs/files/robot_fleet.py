@@ -0,0 +1,441 @@
+"""
+Robot Fleet Simulation
+ICTPRG430 - Week 4 Extension: Struct-of-Arrays Data Layout
+
+Stores a whole fleet of e-puck robots as NumPy columns ("struct of arrays")
+instead of one EPuckRobot object per robot ("array of structs").
+
+A Fleet keeps one array per attribute (positions, battery levels, distance
+travelled, wheel speeds, an LED bitmask and proximity sensor calibration
+offsets). move_to, charge_battery, set_wheel_speeds and read_sensors work on
+any set of robots with a few array operations.
+fleet[i] returns a lightweight RobotProxy that offers the familiar
+per-robot Robot / EPuckRobot methods and attributes, backed by the same
+arrays.
+"""
+
+import math
+
+import numpy as np
+
+from class_implementation_examples import EPuckRobot
+
+NUM_LEDS = 8
+NUM_SENSORS = len(EPuckRobot.SENSOR_POSITIONS)  # Proximity sensors per robot
+
+
+class Fleet:
+    """
+    Struct-of-arrays container for many e-puck robots.
+
+    Methods that take `robots` accept anything NumPy can index with: an
+    int, a slice, an array of indices, a boolean mask, or None for every
+    robot. Unlike Robot, fleet methods do not print; they return what
+    happened instead.
+    """
+
+    def __init__(self, size: int, initial_battery: float = 100.0, id_prefix: str = "R",
+                 seed=None):
+        """
+        Create a fleet of robots at the origin.
+
+        Args:
+            size (int): Number of robots
+            initial_battery (float): Starting battery level (0.0-100.0),
+                or an array with one level per robot
+            id_prefix (str): Robot IDs are id_prefix plus a zero-padded index
+            seed: Seed for the fleet's sensor generator (default: fresh entropy)
+        """
+        self.size = size
+        self.id_prefix = id_prefix
+        self._id_width = max(3, len(str(size - 1)))
+
+        self.position = np.zeros((size, 2))                # x, y per robot
+        self.battery_level = np.clip(np.broadcast_to(
+            np.asarray(initial_battery, dtype=np.float64), (size,)), 0.0, 100.0)
+        self.total_distance = np.zeros(size)
+        self.wheel_speeds = np.zeros((size, 2))            # left, right per robot
+        self.is_moving = np.zeros(size, dtype=bool)
+        self.leds = np.zeros(size, dtype=np.uint8)         # Bit i set = LED i on
+
+        # One generator for every sensor in the fleet; offsets as in IRSensor
+        self._rng = np.random.default_rng(seed)
+        self.calibration_offsets = self._rng.uniform(-2, 2, (size, NUM_SENSORS)).astype(np.float32)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> "RobotProxy":
+        """Returns a proxy with the per-robot API for robot `index`."""
+        if not -self.size <= index < self.size:
+            raise IndexError(f"robot index {index} out of range for fleet of {self.size}")
+        return RobotProxy(self, index % self.size)
+
+    def __iter__(self):
+        return (RobotProxy(self, index) for index in range(self.size))
+
+    def _rows(self, robots):
+        """Convert a robots selector into an array of row indices."""
+        if robots is None:
+            return np.arange(self.size)
+        return np.arange(self.size)[robots].reshape(-1)
+
+    def robot_id(self, index: int) -> str:
+        """Returns the ID of robot `index`."""
+        return f"{self.id_prefix}{index:0{self._id_width}d}"
+
+    def move_to(self, robots, x, y):
+        """
+        Move robots to target coordinates, with the same rules as Robot.move_to.
+
+        A robot only moves if its battery is not depleted and covers the
+        cost of the move (0.1% per unit of distance).
+
+        Args:
+            robots: Robots to move
+            x: Target x coordinate, one per robot or a single value
+            y: Target y coordinate, one per robot or a single value
+
+        Returns:
+            numpy.ndarray: Boolean mask, True for each selected robot that moved
+        """
+        rows = self._rows(robots)
+        targets = np.stack(np.broadcast_arrays(
+            np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64), rows)[:2], axis=-1)
+
+        distance = np.hypot(*(targets - self.position[rows]).T)
+        battery_cost = distance * 0.1
+        battery = self.battery_level[rows]
+        moved = (battery > 0) & (battery_cost <= battery)
+
+        moving_rows = rows[moved]
+        self.position[moving_rows] = targets[moved]
+        self.battery_level[moving_rows] -= battery_cost[moved]
+        self.total_distance[moving_rows] += distance[moved]
+        self.is_moving[moving_rows] = False  # Movement complete
+        return moved
+
+    def charge_battery(self, robots, amount):
+        """
+        Charge robots' batteries, capped at 100%.
+
+        Args:
+            robots: Robots to charge
+            amount: Charge to add (percentage), one per robot or a single value
+
+        Returns:
+            numpy.ndarray: Charge actually added to each selected robot
+        """
+        rows = self._rows(robots)
+        old_level = self.battery_level[rows]
+        new_level = np.minimum(100.0, old_level + amount)
+        self.battery_level[rows] = new_level
+        return new_level - old_level
+
+    def set_wheel_speeds(self, robots, left_speed, right_speed):
+        """
+        Set wheel speeds, clamped to -1.0..1.0, as EPuckRobot.set_wheel_speeds does.
+
+        Args:
+            robots: Robots to update
+            left_speed: Left wheel speed, one per robot or a single value
+            right_speed: Right wheel speed, one per robot or a single value
+        """
+        rows = self._rows(robots)
+        left_speed = np.broadcast_to(np.asarray(left_speed, dtype=np.float64), rows.shape)
+        right_speed = np.broadcast_to(np.asarray(right_speed, dtype=np.float64), rows.shape)
+
+        self.wheel_speeds[rows, 0] = np.clip(left_speed, -1.0, 1.0)
+        self.wheel_speeds[rows, 1] = np.clip(right_speed, -1.0, 1.0)
+        self.is_moving[rows] = (left_speed != 0) | (right_speed != 0)
+
+    def set_led_state(self, robots, led_id: int, state: bool):
+        """
+        Turn one LED on or off for each selected robot.
+
+        Args:
+            robots: Robots to update
+            led_id (int): LED identifier (0-7)
+            state (bool): True to turn on, False to turn off
+        """
+        if not 0 <= led_id < NUM_LEDS:
+            raise ValueError(f"Invalid LED ID {led_id}. Must be 0-{NUM_LEDS - 1}.")
+        rows = self._rows(robots)
+        if state:
+            self.leds[rows] |= np.uint8(1 << led_id)
+        else:
+            self.leds[rows] &= np.uint8(~(1 << led_id) & 0xFF)
+
+    def set_all_leds(self, robots, state: bool):
+        """
+        Turn all LEDs on or off for each selected robot.
+
+        Args:
+            robots: Robots to update
+            state (bool): True to turn all on, False to turn all off
+        """
+        self.leds[self._rows(robots)] = 0xFF if state else 0
+
+    def read_sensors(self, robots=None):
+        """
+        Read every proximity sensor of the selected robots at once.
+
+        Readings follow IRSensor.get_reading(): a random 1-100 cm value plus
+        the sensor's calibration offset, clamped to 1-100 and truncated.
+
+        Args:
+            robots: Robots to read
+
+        Returns:
+            numpy.ndarray: int64 array of shape (robots, NUM_SENSORS)
+        """
+        rows = self._rows(robots)
+        readings = self._rng.integers(1, 101, size=(len(rows), NUM_SENSORS)).astype(np.float32)
+        readings += self.calibration_offsets[rows]
+        np.clip(readings, 1, 100, out=readings)
+        return readings.astype(np.int64)
+
+    def get_distance_from_origin(self, robots=None):
+        """
+        Returns each selected robot's distance from the origin (0, 0).
+
+        Returns:
+            numpy.ndarray: One distance per selected robot
+        """
+        return np.hypot(*self.position[self._rows(robots)].T)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the fleet's columns, in bytes."""
+        return sum(column.nbytes for column in (self.position, self.battery_level,
+                                                self.total_distance, self.wheel_speeds,
+                                                self.is_moving, self.leds,
+                                                self.calibration_offsets))
+
+
+def _coordinate(value: float):
+    """
+    Returns a stored coordinate as Robot.get_status() would show it.
+
+    The fleet stores floats, so whole numbers (like the targets usually
+    passed to move_to) are shown as ints and everything else in full.
+    """
+    return int(value) if value.is_integer() else value
+
+
+class RobotProxy:
+    """
+    Per-robot view of a Fleet with the familiar Robot / EPuckRobot API.
+
+    A proxy only holds a reference to the fleet and its row, so creating
+    one is cheap and every change goes straight to the fleet's arrays.
+    Attributes such as battery_level and position_x can be assigned as on
+    Robot. led_states and wheel_speeds are copies; change them with
+    set_led_state() and set_wheel_speeds().
+    """
+
+    __slots__ = ("fleet", "index")
+
+    def __init__(self, fleet: Fleet, index: int):
+        self.fleet = fleet
+        self.index = index
+
+    @property
+    def robot_id(self) -> str:
+        return self.fleet.robot_id(self.index)
+
+    @property
+    def position_x(self) -> float:
+        return float(self.fleet.position[self.index, 0])
+
+    @position_x.setter
+    def position_x(self, value: float):
+        self.fleet.position[self.index, 0] = value
+
+    @property
+    def position_y(self) -> float:
+        return float(self.fleet.position[self.index, 1])
+
+    @position_y.setter
+    def position_y(self, value: float):
+        self.fleet.position[self.index, 1] = value
+
+    @property
+    def battery_level(self) -> float:
+        return float(self.fleet.battery_level[self.index])
+
+    @battery_level.setter
+    def battery_level(self, value: float):
+        self.fleet.battery_level[self.index] = value
+
+    @property
+    def total_distance(self) -> float:
+        return float(self.fleet.total_distance[self.index])
+
+    @total_distance.setter
+    def total_distance(self, value: float):
+        self.fleet.total_distance[self.index] = value
+
+    @property
+    def is_moving(self) -> bool:
+        return bool(self.fleet.is_moving[self.index])
+
+    @is_moving.setter
+    def is_moving(self, value: bool):
+        self.fleet.is_moving[self.index] = value
+
+    @property
+    def sensors(self) -> list:
+        """Proximity sensors as SensorProxy objects, like EPuckRobot.sensors."""
+        return [SensorProxy(self.fleet, self.index, sensor) for sensor in range(NUM_SENSORS)]
+
+    @property
+    def led_states(self) -> list:
+        """LED states as a list of 8 booleans, like EPuckRobot.led_states."""
+        leds = int(self.fleet.leds[self.index])
+        return [bool(leds >> led & 1) for led in range(NUM_LEDS)]
+
+    @property
+    def wheel_speeds(self) -> dict:
+        """Wheel speeds as a dict, like EPuckRobot.wheel_speeds."""
+        left, right = self.fleet.wheel_speeds[self.index].tolist()
+        return {"left": left, "right": right}
+
+    def move_to(self, x: float, y: float) -> bool:
+        """Move this robot; returns True if it moved."""
+        return bool(self.fleet.move_to(self.index, x, y)[0])
+
+    def charge_battery(self, amount: float) -> float:
+        """Charge this robot; returns the charge actually added."""
+        return float(self.fleet.charge_battery(self.index, amount)[0])
+
+    def set_wheel_speeds(self, left_speed: float, right_speed: float):
+        self.fleet.set_wheel_speeds(self.index, left_speed, right_speed)
+
+    def set_led_state(self, led_id: int, state: bool):
+        self.fleet.set_led_state(self.index, led_id, state)
+
+    def set_all_leds(self, state: bool):
+        self.fleet.set_all_leds(self.index, state)
+
+    def read_sensors(self) -> list:
+        """Read this robot's proximity sensors, like EPuckRobot.read_sensors()."""
+        return self.fleet.read_sensors(self.index)[0].tolist()
+
+    def get_distance_from_origin(self) -> float:
+        return math.hypot(self.position_x, self.position_y)
+
+    def get_status(self) -> str:
+        """
+        Get status information in the same format as EPuckRobot.get_status().
+
+        Returns:
+            str: Formatted status string
+        """
+        robot_id = self.robot_id
+        led_status = "".join("●" if led else "○" for led in self.led_states)
+        wheels = self.wheel_speeds
+        return "\n".join([
+            f"=== Robot {robot_id} Status ===",
+            f"Position: ({_coordinate(self.position_x)}, {_coordinate(self.position_y)})",
+            f"Battery: {self.battery_level:.1f}%",
+            f"Moving: {self.is_moving}",
+            f"Total Distance: {self.total_distance:.1f} units",
+            "",
+            f"LED States: {led_status}",
+            f"Wheel Speeds: L={wheels['left']:.2f}, R={wheels['right']:.2f}",
+            f"Sensors: {NUM_SENSORS} proximity sensors available",
+            "=" * (len(f"Robot {robot_id} Status") + 6),
+        ])
+
+    def __repr__(self) -> str:
+        return f"RobotProxy({self.robot_id!r})"
+
+
+class SensorProxy:
+    """
+    One proximity sensor of a fleet robot with the IRSensor API.
+
+    Readings come from the fleet's generator and the calibration offset is
+    stored in Fleet.calibration_offsets, so calibrating through a proxy
+    also affects Fleet.read_sensors().
+    """
+
+    __slots__ = ("fleet", "index", "sensor")
+
+    def __init__(self, fleet: Fleet, index: int, sensor: int):
+        self.fleet = fleet
+        self.index = index
+        self.sensor = sensor
+
+    @property
+    def name(self) -> str:
+        return EPuckRobot.SENSOR_POSITIONS[self.sensor]
+
+    @property
+    def calibration_offset(self) -> float:
+        return float(self.fleet.calibration_offsets[self.index, self.sensor])
+
+    @calibration_offset.setter
+    def calibration_offset(self, value: float):
+        self.fleet.calibration_offsets[self.index, self.sensor] = value
+
+    def get_reading(self) -> int:
+        """Read this sensor alone, like IRSensor.get_reading()."""
+        base_reading = int(self.fleet._rng.integers(1, 101))
+        return max(1, min(100, int(base_reading + self.calibration_offset)))
+
+    def calibrate(self, reference_distance: int):
+        """Calibrate against a known distance in cm, like IRSensor.calibrate()."""
+        current_reading = int(self.fleet._rng.integers(1, 101))
+        self.calibration_offset = reference_distance - current_reading
+        print(f"Sensor '{self.name}' calibrated. Offset: {self.calibration_offset:.2f}")
+
+    def __repr__(self) -> str:
+        return f"SensorProxy({self.fleet.robot_id(self.index)!r}, {self.name!r})"
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import time
+    import tracemalloc
+
+    print("=== Robot Fleet Simulation ===\n")
+
+    fleet = Fleet(100_000, initial_battery=50.0)
+    rng = np.random.default_rng(0)
+
+    started = time.perf_counter()
+    moved = fleet.move_to(None, rng.uniform(-50, 50, len(fleet)), rng.uniform(-50, 50, len(fleet)))
+    elapsed = time.perf_counter() - started
+    print(f"Moved {np.count_nonzero(moved):,} of {len(fleet):,} robots in {elapsed * 1000:.1f} ms")
+
+    low = fleet.battery_level < 45
+    fleet.charge_battery(low, 10.0)
+    fleet.set_wheel_speeds(slice(0, 1000), 0.5, 0.3)
+    fleet.set_led_state(np.arange(0, len(fleet), 2), 0, True)
+    print(f"Charged {np.count_nonzero(low):,} robots below 45% battery")
+
+    # Per-robot API through a proxy
+    robot = fleet[7]
+    robot.set_led_state(2, True)
+    robot.move_to(5, 8)
+    print(robot.get_status())
+    print(f"Proximity sensors: {robot.read_sensors()}")
+
+    started = time.perf_counter()
+    readings = fleet.read_sensors()
+    elapsed = time.perf_counter() - started
+    print(f"Read {readings.size:,} sensors across the fleet in {elapsed * 1000:.1f} ms")
+
+    # Memory: fleet columns versus EPuckRobot objects
+    sample = 1000
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        robots = [EPuckRobot(f"E{i}", 50.0, seed=i) for i in range(sample)]
+    object_bytes = tracemalloc.get_traced_memory()[0] / sample
+    tracemalloc.stop()
+    del robots
+    print(f"\nMemory per robot: Fleet {fleet.nbytes / len(fleet):.0f} bytes, "
+          f"EPuckRobot object ~{object_bytes:,.0f} bytes")
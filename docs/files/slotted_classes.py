@@ -0,0 +1,194 @@
+"""
+Compact Class Variants with __slots__
+ICTPRG430 - Week 4 Extension: Memory Layout of Objects
+
+Slot-based versions of IRSensor, Lidar, Robot and EPuckRobot from
+class_implementation_examples.py, for scenario sweeps that create tens of
+thousands of objects.
+
+Each variant derives from the same base class as the original (IRSensorBase,
+LidarBase, RobotBase, EPuckRobotBase). The bases hold every method and have
+an empty __slots__, so a variant that lists its attributes in __slots__ has
+no per-instance __dict__ at all; assigning an attribute that is not listed
+raises AttributeError. Behaviour stays identical to the originals, but
+isinstance() checks should use the base classes, since a SlottedRobot is not
+a Robot.
+
+SlottedEPuckRobot packs its 8 LED states into an int bitmask and stores its
+wheel speeds as two floats. led_states and wheel_speeds are live views of
+those, so epuck.led_states[0] = True and epuck.wheel_speeds["left"] = 0.5
+work as they do on EPuckRobot.
+
+Run this file to compare memory use and instantiation time.
+"""
+
+from collections.abc import MutableMapping, Sequence
+
+from class_implementation_examples import (EPuckRobot, EPuckRobotBase, IRSensor, IRSensorBase,
+                                           Lidar, LidarBase, Robot, RobotBase)
+
+
+class SlottedIRSensor(IRSensorBase):
+    """IRSensor with its attributes in __slots__."""
+
+    __slots__ = ('name', '_seed', '_rng', 'calibration_offset')
+
+
+class SlottedLidar(LidarBase):
+    """Lidar with its attributes in __slots__."""
+
+    __slots__ = ('num_measurements', 'min_range', 'max_range', 'scan_count',
+                 'partial_scan_count', 'overrun_count', '_rng', '_angle_factors',
+                 '_sector_buffer', '_beam_trig', '_scan_scratch')
+
+
+class SlottedRobot(RobotBase):
+    """Robot with its attributes in __slots__."""
+
+    __slots__ = ('robot_id', 'battery_level', 'position_x', 'position_y',
+                 'is_moving', 'total_distance', '_status_cache', '_status_bytes_cache')
+
+
+class LedStates(Sequence):
+    """List-like view of a SlottedEPuckRobot's LED bitmask."""
+
+    __slots__ = ('robot',)
+
+    def __init__(self, robot):
+        self.robot = robot
+
+    def __len__(self) -> int:
+        return 8
+
+    def __getitem__(self, led):
+        if isinstance(led, slice):
+            return [self[i] for i in range(8)[led]]
+        return bool(self.robot.leds >> range(8)[led] & 1)
+
+    def __setitem__(self, led: int, state: bool):
+        bit = 1 << range(8)[led]
+        self.robot.leds = self.robot.leds | bit if state else self.robot.leds & ~bit
+
+    def __eq__(self, other) -> bool:
+        return list(self) == (list(other) if isinstance(other, LedStates) else other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class WheelSpeeds(MutableMapping):
+    """Dict-like view of a SlottedEPuckRobot's left_speed and right_speed."""
+
+    __slots__ = ('robot',)
+
+    ATTRIBUTES = {"left": "left_speed", "right": "right_speed"}
+
+    def __init__(self, robot):
+        self.robot = robot
+
+    def __len__(self) -> int:
+        return 2
+
+    def __iter__(self):
+        return iter(self.ATTRIBUTES)
+
+    def __getitem__(self, side: str) -> float:
+        return getattr(self.robot, self.ATTRIBUTES[side])
+
+    def __setitem__(self, side: str, speed: float):
+        setattr(self.robot, self.ATTRIBUTES[side], speed)
+
+    def __delitem__(self, side: str):
+        raise TypeError("wheel speeds cannot be removed")
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class SlottedEPuckRobot(EPuckRobotBase, SlottedRobot):
+    """
+    EPuckRobot with its attributes in __slots__.
+
+    LED states are bits of the int `leds` (bit i set means LED i is on) and
+    the wheel speeds are the floats `left_speed` and `right_speed`. Every
+    method, including __init__ and get_status(), comes from EPuckRobotBase
+    and works through the led_states and wheel_speeds views.
+    """
+
+    __slots__ = ('leds', 'left_speed', 'right_speed', 'sensors', '_bank_seed',
+                 '_bank_rng', '_bank_draws', '_bank_next', '_bank_values', '_bank_readings')
+
+    sensor_class = SlottedIRSensor
+
+    @property
+    def led_states(self) -> LedStates:
+        """LED states as a list-like view of 8 booleans."""
+        return LedStates(self)
+
+    @led_states.setter
+    def led_states(self, states):
+        self.leds = sum(1 << led for led, state in enumerate(states) if state)
+
+    @property
+    def wheel_speeds(self) -> WheelSpeeds:
+        """Wheel speeds as a dict-like {"left", "right"} view."""
+        return WheelSpeeds(self)
+
+    @wheel_speeds.setter
+    def wheel_speeds(self, speeds):
+        self.left_speed = speeds["left"]
+        self.right_speed = speeds["right"]
+
+
+def _benchmark(factory, count: int):
+    """
+    Measure memory and time to create `count` objects with factory(i).
+
+    Returns:
+        tuple: (bytes per object, microseconds per object)
+    """
+    import contextlib
+    import io
+    import time
+    import tracemalloc
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        objects = [factory(i) for i in range(count)]
+        elapsed = time.perf_counter() - started
+
+        del objects
+        tracemalloc.start()
+        objects = [factory(i) for i in range(count)]
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+    return allocated / count, elapsed / count * 1e6
+
+
+if __name__ == "__main__":
+    print("=== __slots__ Class Variants ===\n")
+
+    pairs = [
+        ("IRSensor", lambda i: IRSensor("Front", seed=i),
+         lambda i: SlottedIRSensor("Front", seed=i), 20000),
+        ("Lidar", lambda i: Lidar(36, seed=i), lambda i: SlottedLidar(36, seed=i), 20000),
+        ("Robot", lambda i: Robot(f"R{i}", 80.0), lambda i: SlottedRobot(f"R{i}", 80.0), 50000),
+        ("EPuckRobot", lambda i: EPuckRobot(f"E{i}", 80.0, seed=i),
+         lambda i: SlottedEPuckRobot(f"E{i}", 80.0, seed=i), 2000),
+    ]
+
+    print(f"{'Class':<12}{'bytes/object':>26}{'µs/object':>22}")
+    print(f"{'':<12}{'original':>13}{'slotted':>13}{'original':>11}{'slotted':>11}")
+    for name, original, slotted, count in pairs:
+        original_bytes, original_time = _benchmark(original, count)
+        slotted_bytes, slotted_time = _benchmark(slotted, count)
+        print(f"{name:<12}{original_bytes:>13,.0f}{slotted_bytes:>13,.0f}"
+              f"{original_time:>11.1f}{slotted_time:>11.1f}")
+
+    print("\nSlotted e-puck behaves like the original:")
+    epuck = SlottedEPuckRobot("EPuck_Slots", 90.0, seed=1)
+    epuck.set_led_state(0, True)
+    epuck.set_wheel_speeds(0.5, 0.3)
+    epuck.move_to(5, 8)
+    print(epuck.get_status())
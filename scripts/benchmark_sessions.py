@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Session Generation Benchmark
+Times each stage of the session generation pipeline on synthetic inputs.
+
+Two sweeps are run by default: a growing number of configs against a fixed
+10 KB template, and growing template sizes against a fixed 10 configs. For
+each case the load (read + compile), render, navigation and write stages are
+timed separately, then run again under tracemalloc to record peak memory.
+The write stage writes sessions rendered beforehand, so it does not include
+render time.
+Results are saved as JSON so runs from different commits can be compared.
+
+Usage:
+    python scripts/benchmark_sessions.py
+    python scripts/benchmark_sessions.py --configs 10 100 --template-sizes 1KB 1MB
+    python scripts/benchmark_sessions.py --output new.json --compare old.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import generate_session as generator
+
+DEFAULT_CONFIG_COUNTS = [10, 100, 1000, 10000]
+DEFAULT_TEMPLATE_SIZES = ["1KB", "10KB", "100KB", "1MB"]
+FIXED_TEMPLATE_SIZE = "10KB"
+FIXED_CONFIG_COUNT = 10
+OUTPUT_PATH = "session-benchmark.json"
+
+TEMPLATE_HEADER = """# Session {{SESSION_NUMBER}}: {{SESSION_TITLE}}
+
+## Session Structure
+
+{{#components}}
+{{@index}}. **{{name}}** - {{description}}
+{{/components}}
+
+"""
+
+TEMPLATE_BLOCK = """## {{BLOCK_%d_TITLE}}
+
+{{BLOCK_%d_CONTENT}}
+
+{{#objectives}}
+- {{.}}
+{{/objectives}}
+
+"""
+
+
+def parse_size(text: str) -> int:
+    """Parse a size such as '512', '10KB' or '1MB' into bytes."""
+    text = text.strip().upper()
+    for suffix, factor in (("MB", 1024 * 1024), ("KB", 1024), ("B", 1)):
+        if text.endswith(suffix):
+            return int(float(text[:-len(suffix)]) * factor)
+    return int(text)
+
+
+def synthesize_template(target_bytes: int):
+    """
+    Build template source of at least target_bytes.
+
+    Returns:
+        tuple: (source, block_count)
+    """
+    parts = [TEMPLATE_HEADER]
+    size = len(TEMPLATE_HEADER)
+    blocks = 0
+    while size < target_bytes:
+        block = TEMPLATE_BLOCK % (blocks, blocks)
+        parts.append(block)
+        size += len(block)
+        blocks += 1
+    return "".join(parts), blocks
+
+
+def synthesize_config(session_number: int, blocks: int) -> dict:
+    """Build a config providing every placeholder of a synthesized template."""
+    config = {
+        'SESSION_NUMBER': str(session_number),
+        'SESSION_TITLE': f"Synthetic Session {session_number}",
+        'components': [{'name': f"Component {i}", 'description': f"Description of component {i}"}
+                       for i in range(1, 6)],
+        'objectives': [f"Objective {i} for session {session_number}" for i in range(1, 6)],
+    }
+    for block in range(blocks):
+        config[f'BLOCK_{block}_TITLE'] = f"Block {block} of session {session_number}"
+        config[f'BLOCK_{block}_CONTENT'] = f"Content for block {block}. " * 3
+    return config
+
+
+def _measure(stage):
+    """
+    Run stage() twice: once timed, once under tracemalloc.
+
+    Returns:
+        tuple: (result, seconds, peak_bytes)
+    """
+    started = time.perf_counter()
+    result = stage()
+    seconds = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        stage()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, seconds, peak
+
+
+def run_case(config_count: int, template_bytes: int, work_dir: str) -> dict:
+    """Benchmark every pipeline stage for one (config count, template size) case."""
+    source, blocks = synthesize_template(template_bytes)
+    configs = [synthesize_config(number, blocks) for number in range(1, config_count + 1)]
+
+    template_path = os.path.join(work_dir, "session-template.md")
+    with open(template_path, 'w') as f:
+        f.write(source)
+
+    def load():
+        generator._template_cache.clear()
+        return generator.load_template(template_path)
+
+    def render():
+        return sum(len(template.render(config)[0]) for config in configs)
+
+    def navigation():
+        return [generator.session_navigation(config) for config in configs]
+
+    output_dir = os.path.join(work_dir, "sessions")
+    os.makedirs(output_dir, exist_ok=True)
+
+    def write():
+        # Same buffered write and atomic rename as write_session(), without rendering
+        for config, content in zip(configs, rendered):
+            output_file = os.path.join(output_dir, f"session-{config['SESSION_NUMBER']}.md")
+            temp_file = f"{output_file}.tmp"
+            generator.write_chunks([content], temp_file)
+            os.replace(temp_file, output_file)
+
+    template, load_seconds, load_peak = _measure(load)
+    rendered_bytes, render_seconds, render_peak = _measure(render)
+    _, nav_seconds, nav_peak = _measure(navigation)
+    rendered = [template.render(config)[0] for config in configs]
+    _, write_seconds, write_peak = _measure(write)
+    del rendered
+
+    def stage(seconds, peak):
+        return {
+            'seconds': seconds,
+            'peak_bytes': peak,
+            'configs_per_second': config_count / seconds if seconds else None,
+        }
+
+    stages = {
+        'load': {'seconds': load_seconds, 'peak_bytes': load_peak,
+                 'mb_per_second': len(source) / 1e6 / load_seconds if load_seconds else None},
+        'render': stage(render_seconds, render_peak),
+        'navigation': stage(nav_seconds, nav_peak),
+        'write': stage(write_seconds, write_peak),
+    }
+    stages['render']['mb_per_second'] = (
+        rendered_bytes / 1e6 / render_seconds if render_seconds else None)
+
+    return {
+        'configs': config_count,
+        'template_bytes': len(source),
+        'rendered_bytes': rendered_bytes,
+        'stages': stages,
+    }
+
+
+def current_commit():
+    """Return the current git commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _case_key(case):
+    return case['configs'], case['template_bytes']
+
+
+def print_case(case):
+    """Print one benchmark case as a summary line per stage."""
+    print(f"\n{case['configs']} configs x {case['template_bytes'] / 1024:.0f} KB template")
+    for name, stage in case['stages'].items():
+        rate = stage.get('configs_per_second')
+        throughput = f"{rate:,.0f} configs/s" if rate and name != 'load' else ""
+        if stage.get('mb_per_second'):
+            throughput = (throughput + ", " if throughput else "") + f"{stage['mb_per_second']:.1f} MB/s"
+        print(f"  {name:<11}{stage['seconds'] * 1000:>10.2f} ms  "
+              f"peak {stage['peak_bytes'] / 1024:>10.1f} KB  {throughput}")
+
+
+def compare_results(current, baseline):
+    """Print the time ratio (current / baseline) of each stage for matching cases."""
+    previous = {_case_key(case): case for case in baseline['results']}
+    print(f"\n📊 Compared with {baseline.get('commit') or 'baseline'} (ratio > 1 is slower):")
+    for case in current['results']:
+        old = previous.get(_case_key(case))
+        if old is None:
+            continue
+        ratios = []
+        for name, stage in case['stages'].items():
+            old_seconds = old['stages'].get(name, {}).get('seconds')
+            if old_seconds:
+                ratios.append(f"{name} {stage['seconds'] / old_seconds:.2f}x")
+        print(f"  {case['configs']} configs x {case['template_bytes'] / 1024:.0f} KB: "
+              f"{', '.join(ratios)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the session generation pipeline')
+    parser.add_argument('--configs', type=int, nargs='+', default=DEFAULT_CONFIG_COUNTS,
+                        help=f'Config counts to sweep at {FIXED_TEMPLATE_SIZE} (default: %(default)s)')
+    parser.add_argument('--template-sizes', nargs='+', default=DEFAULT_TEMPLATE_SIZES,
+                        help=f'Template sizes to sweep with {FIXED_CONFIG_COUNT} configs (default: %(default)s)')
+    parser.add_argument('--output', default=OUTPUT_PATH, help='JSON results file (default: %(default)s)')
+    parser.add_argument('--compare', help='Previous JSON results file to compare against')
+
+    args = parser.parse_args()
+
+    cases = [(count, parse_size(FIXED_TEMPLATE_SIZE)) for count in args.configs]
+    cases += [(FIXED_CONFIG_COUNT, parse_size(size)) for size in args.template_sizes]
+    cases = list(dict.fromkeys(cases))
+
+    results = {
+        'commit': current_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': [],
+    }
+
+    for config_count, template_bytes in cases:
+        with tempfile.TemporaryDirectory() as work_dir:
+            case = run_case(config_count, template_bytes, work_dir)
+        results['results'].append(case)
+        print_case(case)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n💾 Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            compare_results(results, json.load(f))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Anchor Checker Script
+Builds an index of heading anchors for every markdown file under docs/ and
+validates mkdocs.yml nav anchors and intra-doc links against it.
+
+Heading slugs are produced the same way as the Python-Markdown toc extension
+(including _1, _2 suffixes for duplicate headings), so an anchor that passes
+here resolves in the built site. Per-file results are cached by content hash
+in .anchor-cache.json; only changed files are re-parsed, in parallel.
+
+Usage:
+    python scripts/check_anchors.py
+    python scripts/check_anchors.py --docs-dir docs --mkdocs mkdocs.yml --jobs 4
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from urllib.parse import unquote
+
+from mkdocs_nav import MKDOCS_PATH, nav_targets
+
+DOCS_DIR = Path("docs")
+CACHE_PATH = Path(".anchor-cache.json")
+
+# Bump when slug or link extraction rules change to invalidate old caches
+CACHE_VERSION = 1
+
+FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+HEADING_PATTERN = re.compile(r"^ {0,3}(#{1,6})\s+(.*?)\s*#*\s*$")
+HEADING_ATTR_PATTERN = re.compile(r"\s*\{:?\s*([^}]*)\}\s*$")
+HTML_ID_PATTERN = re.compile(r"""<[^>]+\sid=["']([^"']+)["']""")
+INLINE_LINK_PATTERN = re.compile(r"(!?)\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+[\"'][^)]*)?\)")
+REFERENCE_LINK_PATTERN = re.compile(r"^ {0,3}\[[^\]]+\]:\s*<?(\S+?)>?(?:\s|$)")
+CODE_SPAN_PATTERN = re.compile(r"`+[^`]*`+")
+EMOJI_PATTERN = re.compile(r":[a-z0-9_+-]+:")
+EXTERNAL_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+
+
+def slugify(value: str, separator: str = "-") -> str:
+    """
+    Slugify a heading exactly like markdown.extensions.toc.slugify.
+
+    Args:
+        value (str): Plain heading text
+        separator (str): Word separator (default: "-")
+
+    Returns:
+        str: Anchor slug
+    """
+    value = unicodedata.normalize('NFKD', value)
+    value = value.encode('ascii', 'ignore').decode('ascii')
+    value = re.sub(r'[^\w\s-]', '', value).strip().lower()
+    return re.sub(r'[{}\s]+'.format(re.escape(separator)), separator, value)
+
+
+def heading_text(markdown: str) -> str:
+    """Reduce inline heading markdown to the plain text toc slugifies."""
+    text = re.sub(r"!?\[([^\]]*)\]\([^)]*\)", r"\1", markdown)   # links and images
+    text = re.sub(r"`+([^`]*)`+", r"\1", text)                   # code spans
+    text = re.sub(r"<[^>]+>", "", text)                           # inline HTML
+    text = EMOJI_PATTERN.sub("", text)                            # :material-...: icons
+    return re.sub(r"(\*{1,3}|_{1,3}|~~|==|\^\^)(\S.*?\S|\S)\1", r"\2", text)
+
+
+def unique_slug(slug: str, used: set) -> str:
+    """Return slug, suffixed with _1, _2, ... if already used (as toc does)."""
+    candidate = slug
+    counter = 0
+    while candidate in used or not candidate:
+        counter += 1
+        candidate = f"{slug}_{counter}"
+    used.add(candidate)
+    return candidate
+
+
+def index_markdown(text: str) -> dict:
+    """
+    Extract anchors and links from markdown text in a single pass.
+
+    Returns:
+        dict: {'anchors': [...], 'links': [[line_number, target], ...]}
+    """
+    anchors = []
+    used = set()
+    links = []
+    fence = None
+
+    for line_number, line in enumerate(text.splitlines(), 1):
+        fence_match = FENCE_PATTERN.match(line)
+        if fence_match:
+            marker = fence_match.group(1)
+            if fence is None:
+                fence = marker
+            elif marker == fence:
+                fence = None
+            continue
+        if fence is not None:
+            continue
+
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            title = heading.group(2)
+            attrs = HEADING_ATTR_PATTERN.search(title)
+            custom_id = None
+            if attrs:
+                title = title[:attrs.start()]
+                id_match = re.search(r"#([\w-]+)", attrs.group(1))
+                custom_id = id_match.group(1) if id_match else None
+            if custom_id:
+                used.add(custom_id)
+                anchors.append(custom_id)
+            else:
+                anchors.append(unique_slug(slugify(heading_text(title)), used))
+
+        anchors.extend(HTML_ID_PATTERN.findall(line))
+
+        searchable = CODE_SPAN_PATTERN.sub("", line)
+        for is_image, target in INLINE_LINK_PATTERN.findall(searchable):
+            if not is_image:
+                links.append([line_number, target])
+        reference = REFERENCE_LINK_PATTERN.match(searchable)
+        if reference:
+            links.append([line_number, reference.group(1)])
+
+    return {'anchors': anchors, 'links': links}
+
+
+def _index_file(path):
+    """Worker: read and index a single markdown file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return index_markdown(f.read())
+
+
+def load_cache(cache_path=CACHE_PATH):
+    """Load the per-file anchor cache, discarding it if the version differs."""
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+    if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache.get('files', {})
+
+
+def save_cache(files, cache_path=CACHE_PATH):
+    """Write the per-file anchor cache."""
+    with open(cache_path, 'w') as f:
+        json.dump({'version': CACHE_VERSION, 'files': files}, f, sort_keys=True)
+
+
+def build_index(docs_dir=DOCS_DIR, cache=None, jobs=None):
+    """
+    Build the anchor index for every markdown file under docs_dir.
+
+    Files whose content hash matches the cache are reused as-is; the rest
+    are parsed across a process pool.
+
+    Args:
+        docs_dir (str): Documentation root
+        cache (dict): Previous index entries keyed by relative path
+        jobs (int): Worker processes (default: CPU count)
+
+    Returns:
+        tuple: (index, reparsed) where index maps each docs-relative POSIX
+        path to {'hash', 'anchors', 'links'} and reparsed counts parsed files
+    """
+    docs_dir = Path(docs_dir)
+    cache = cache or {}
+    index = {}
+    stale = {}
+
+    for path in sorted(docs_dir.rglob("*.md")):
+        relative = path.relative_to(docs_dir).as_posix()
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+
+        cached = cache.get(relative)
+        if cached and cached.get('hash') == digest:
+            index[relative] = cached
+        else:
+            stale[relative] = (path, digest)
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            paths = [path for path, _ in stale.values()]
+            for relative, entry in zip(stale, pool.map(_index_file, paths)):
+                entry['hash'] = stale[relative][1]
+                index[relative] = entry
+
+    return index, len(stale)
+
+
+def page_url_dir(base_file: str) -> str:
+    """
+    Return the directory URL MkDocs serves a page at (use_directory_urls).
+
+    'sessions/session-07.md' is served at 'sessions/session-07/', while
+    index.md and README.md pages are served at their folder's URL.
+    """
+    stem, _ = os.path.splitext(base_file)
+    folder, name = os.path.split(stem)
+    if name.lower() in ('index', 'readme'):
+        return folder
+    return stem
+
+
+def resolve_target(index, base_file, target):
+    """
+    Resolve a link or nav target to an indexed markdown file and anchor.
+
+    Links to .md files are resolved from the linking file's folder, as
+    MkDocs does. Other (URL-style) links are left alone by MkDocs and
+    resolved by the browser, so they are resolved from the page's URL.
+
+    Args:
+        index (dict): Anchor index from build_index
+        base_file (str): Docs-relative file the link appears in ('' for nav)
+        target (str): Link target, e.g. '../downloads.md#week-5' or 'sessions/session-05/#intro'
+
+    Returns:
+        tuple: (file, anchor) where file is None if the page does not exist,
+        or (False, None) when the target is not a markdown page to check
+    """
+    path, _, anchor = target.partition('#')
+    path = unquote(path)
+    anchor = unquote(anchor) or None
+
+    if not path:
+        return base_file, anchor
+    if path.startswith('/'):
+        path = path.lstrip('/')
+    elif path.endswith('.md'):
+        path = os.path.join(os.path.dirname(base_file), path)
+    else:
+        path = os.path.join(page_url_dir(base_file), path)
+    path = os.path.normpath(path).replace(os.sep, '/')
+
+    if path.endswith('.md'):
+        candidates = [path]
+    elif not os.path.splitext(path)[1] or target.split('#')[0].endswith('/'):
+        stem = path.rstrip('/')
+        candidates = [f"{stem}.md", f"{stem}/index.md", f"{stem}/README.md"]
+    else:
+        return False, None
+
+    for candidate in candidates:
+        if candidate in index:
+            return candidate, anchor
+    return None, anchor
+
+
+def check_target(index, base_file, target):
+    """Return an error message for a broken target, or None if it resolves."""
+    if EXTERNAL_PATTERN.match(target) or '{{' in target:
+        return None
+
+    page, anchor = resolve_target(index, base_file, target)
+    if page is False:
+        return None
+    if page is None:
+        return f"page not found: {target}"
+    if anchor and anchor not in index[page]['anchors']:
+        return f"anchor '#{anchor}' not found in {page}"
+    return None
+
+
+def check_links(index, nav=()):
+    """
+    Validate nav targets and every intra-doc link against the index.
+
+    Args:
+        index (dict): Anchor index from build_index
+        nav (iterable): (title, target) pairs from mkdocs.yml
+
+    Returns:
+        list: (location, message) pairs for each broken link
+    """
+    problems = []
+
+    for title, target in nav:
+        error = check_target(index, '', target)
+        if error:
+            problems.append((f"mkdocs.yml nav '{title}'", error))
+
+    for page, entry in index.items():
+        for line_number, target in entry['links']:
+            error = check_target(index, page, target)
+            if error:
+                problems.append((f"{page}:{line_number}", error))
+
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check nav anchors and intra-doc links')
+    parser.add_argument('--docs-dir', default=str(DOCS_DIR), help='Documentation root (default: docs)')
+    parser.add_argument('--mkdocs', default=str(MKDOCS_PATH), help='mkdocs.yml path (default: mkdocs.yml)')
+    parser.add_argument('--jobs', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help=f'Ignore and do not update {CACHE_PATH}')
+
+    args = parser.parse_args()
+
+    cache = {} if args.no_cache else load_cache()
+    index, reparsed = build_index(args.docs_dir, cache, args.jobs)
+    if not args.no_cache:
+        save_cache(index)
+
+    nav = []
+    if os.path.exists(args.mkdocs):
+        with open(args.mkdocs, 'r') as f:
+            nav = nav_targets(f.read())
+
+    problems = check_links(index, nav)
+
+    print(f"Indexed {len(index)} markdown files ({reparsed} parsed, "
+          f"{len(index) - reparsed} from cache), {len(nav)} nav entries")
+    for location, message in problems:
+        print(f"❌ {location}: {message}")
+
+    if problems:
+        print(f"\n{len(problems)} broken link(s) found")
+        sys.exit(1)
+    print("✅ All nav anchors and intra-doc links resolve")
+
+if __name__ == "__main__":
+    main()
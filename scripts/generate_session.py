@@ -6,23 +6,472 @@ Generates new session files from the template based on Session 4 structure.
 Usage:
     python scripts/generate_session.py --config configs/session_05_config.json
     python scripts/generate_session.py --interactive
+    python scripts/generate_session.py --config-dir configs --jobs 4
+    python scripts/generate_session.py --watch
 """
 
 import argparse
+import hashlib
 import json
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import re
 
-def load_template():
-    """Load the session template."""
-    template_path = Path("docs/templates/session-template.md")
+import yaml
+
+from check_anchors import slugify
+from mkdocs_nav import MKDOCS_PATH, update_mkdocs_nav
+
+TEMPLATE_PATH = Path("docs/templates/session-template.md")
+MANIFEST_PATH = Path(".session-cache.json")
+
+# Matches {{include:path/to/file.py#L5-20}} directives; the line range is optional
+INCLUDE_DIRECTIVE = r"include:\s*(?P<path>[^\s#}]+)(?:#L(?P<first>\d+)(?:-L?(?P<last>\d+))?)?"
+INCLUDE_PATTERN = re.compile(r"\{\{\s*" + INCLUDE_DIRECTIVE + r"\s*\}\}")
+
+# Matches include directives, {{KEY}} placeholders and {{#list}} / {{^list}} /
+# {{/list}} section tags; whitespace inside the braces is tolerated. {{.}} is
+# the current list item and {{@index}} its 1-based position.
+TAG_PATTERN = re.compile(r"\{\{\s*(?:" + INCLUDE_DIRECTIVE
+                         + r"|(?P<sigil>[#^/]?)\s*(?P<name>\.|@?[A-Za-z0-9_]+))\s*\}\}")
+
+# Section and include node flags
+_SECTION = 1
+_INVERTED = 2
+_INCLUDE = 4
+
+# Sentinel for names missing from every scope
+_MISSING = object()
+
+# Rendered pieces buffered before iter_render yields a chunk
+RENDER_FLUSH_PARTS = 512
+
+# Buffer size for streaming rendered sessions to disk
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# List-valued entries derived from legacy numbered keys: (list key, key format, fields)
+NUMBERED_LISTS = [
+    ('objectives', 'OBJECTIVE_{n}', None),
+    ('components', 'COMPONENT_{n}_{field}', {'name': 'NAME', 'description': 'DESCRIPTION'}),
+    ('sections', 'SECTION_{n}_{field}', {'title': 'TITLE', 'content': 'CONTENT'}),
+    ('steps', 'STEP_{n}', None),
+]
+
+# Compiled templates keyed by resolved path -> (mtime_ns, CompiledTemplate)
+_template_cache = {}
+
+# Included source files keyed by absolute path -> (mtime_ns, size, digest, lines)
+_source_cache = {}
+
+
+def hash_text(text: str) -> str:
+    """Return the SHA-256 hex digest of a text string."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _collect_numbered(config, key_format, fields, consumed):
+    """Collect key_format entries for n = 1, 2, ... until the first gap."""
+    items = []
+    n = 1
+    while True:
+        if fields is None:
+            key = key_format.format(n=n)
+            if key not in config:
+                return items
+            items.append(config[key])
+            consumed.add(key)
+        else:
+            keys = {name: key_format.format(n=n, field=suffix)
+                    for name, suffix in fields.items()}
+            present = {name: key for name, key in keys.items() if key in config}
+            if not present:
+                return items
+            items.append({name: config[key] for name, key in present.items()})
+            consumed.update(present.values())
+        n += 1
+
+
+def numbered_lists(config):
+    """
+    Derive list-valued entries from legacy numbered keys.
+    
+    Configs written for the original template use OBJECTIVE_1..N,
+    COMPONENT_N_NAME, SECTION_N_TITLE, SUBSECTION_N_M_TITLE, STEP_N and so on.
+    These are gathered into ``objectives``, ``components``, ``sections`` (each
+    with ``subsections``) and ``steps`` lists so the loop-based template can
+    render them. Lists already present in the config are not derived.
+    
+    Returns:
+        tuple: (derived, consumed) where derived maps list names to the new
+        lists and consumed is the set of numbered keys that were used
+    """
+    derived = {}
+    consumed = set()
+    
+    for list_key, key_format, fields in NUMBERED_LISTS:
+        if list_key in config:
+            continue
+        items = _collect_numbered(config, key_format, fields, consumed)
+        if not items:
+            continue
+        if list_key == 'sections':
+            for n, section in enumerate(items, 1):
+                section['subsections'] = _collect_numbered(
+                    config, f'SUBSECTION_{n}_{{n}}_{{field}}',
+                    {'title': 'TITLE', 'content': 'CONTENT'}, consumed)
+        derived[list_key] = items
+    
+    return derived, consumed
+
+
+def expand_numbered_keys(config):
+    """
+    Return a copy of config with the lists from numbered_lists added.
+    
+    Returns:
+        tuple: (context, consumed) where context is a new dict including the
+        derived lists and consumed is the set of numbered keys that were used
+    """
+    derived, consumed = numbered_lists(config)
+    return {**config, **derived}, consumed
+
+
+def read_source(path):
+    """
+    Read an included source file through the per-process cache.
+    
+    The file is only re-read when its mtime or size changes, and its line
+    list is kept when the new content hashes the same as before, so every
+    include of the same file in a run shares one read.
+    
+    Returns:
+        tuple: (digest, lines) with lines keeping their line endings
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(path)
+    cached = _source_cache.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2], cached[3]
+    
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    if cached is not None and cached[2] == digest:
+        lines = cached[3]
+    else:
+        lines = data.decode('utf-8').splitlines(keepends=True)
+    
+    _source_cache[key] = (stat.st_mtime_ns, stat.st_size, digest, lines)
+    return digest, lines
+
+
+def source_digest(path):
+    """Return the cached content hash of an included file, or None if it is missing."""
+    try:
+        return read_source(path)[0]
+    except OSError:
+        return None
+
+
+def include_source(path, first=None, last=None):
+    """
+    Return the text of an included file, optionally limited to a line range.
+    
+    Args:
+        path (str): File path, relative to the repository root
+        first (int): First line to include, 1-based (default: whole file)
+        last (int): Last line to include, inclusive (default: same as first)
+    
+    Returns:
+        tuple: (text, digest) where text has its final line ending removed
+    
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the line range is outside the file
+    """
+    digest, lines = read_source(path)
+    
+    if first is not None:
+        last = first if last is None else last
+        if first < 1 or last < first or last > len(lines):
+            raise ValueError(f"lines {first}-{last} outside {path} ({len(lines)} lines)")
+        lines = lines[first - 1:last]
+    
+    text = "".join(lines)
+    if text.endswith('\r\n'):
+        text = text[:-2]
+    elif text.endswith('\n'):
+        text = text[:-1]
+    return text, digest
+
+
+class _RenderState:
+    """Per-render bookkeeping shared by the recursive node walk."""
+    __slots__ = ('unresolved', 'includes', 'top')
+    
+    def __init__(self, top):
+        self.unresolved = {}
+        self.includes = {}
+        self.top = top
+    
+    def include(self, raw, path, first, last):
+        """Return the text for an include directive, or the directive itself on error."""
+        try:
+            text, digest = include_source(path, first, last)
+        except (OSError, ValueError, UnicodeDecodeError):
+            self.unresolved[raw.strip('{} ')] = None
+            return raw
+        
+        self.includes[path] = digest
+        return text
+    
+    def expand_includes(self, value):
+        """Replace include directives inside a config value."""
+        return INCLUDE_PATTERN.sub(
+            lambda match: self.include(match.group(0), match.group('path'),
+                                       _line(match.group('first')), _line(match.group('last'))),
+            value)
+
+
+def _line(number):
+    """Convert an optional line number match group to int."""
+    return int(number) if number else None
+
+
+class _Placeholder(str):
+    """Template node for a {{KEY}} placeholder; the string value is the key."""
+    __slots__ = ()
+
+
+def _lookup(name, scopes):
+    """Resolve name against the scope stack, innermost scope first."""
+    for scope in reversed(scopes):
+        value = scope.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+    return _MISSING
+
+
+class CompiledTemplate:
+    """
+    A session template parsed once into a tree of literal text, placeholders
+    and sections.
+    
+    Each node is either a literal string, a _Placeholder name, a
+    (flags, name, children) tuple for a {{#name}}...{{/name}} section, or an
+    (_INCLUDE, path, first, last, raw) tuple for an include directive.
+    Rendering is a single walk over the tree: a section over a list renders
+    its already-compiled children once per item, so the cost grows with the
+    size of the output rather than with the number of config keys.
+    """
+    
+    def __init__(self, source: str):
+        """
+        Compile template source text.
+        
+        Section tags on a line of their own are removed together with that
+        line, so loops do not leave blank lines behind.
+        
+        Args:
+            source (str): Raw template text containing {{KEY}} placeholders
+        
+        Raises:
+            ValueError: If section tags are unbalanced
+        """
+        self.source = source
+        self.nodes = []
+        names = set()
+        includes = set()
+        
+        # Stack of (name, children, offset) for the currently open sections
+        stack = []
+        children = self.nodes
+        position = 0
+        
+        for match in TAG_PATTERN.finditer(source):
+            sigil, name = match.group('sigil', 'name')
+            start, end = match.span()
+            
+            if sigil:
+                line_start = source.rfind('\n', 0, start) + 1
+                line_end = source.find('\n', end)
+                line_end = len(source) if line_end == -1 else line_end + 1
+                if (line_start >= position and not source[line_start:start].strip()
+                        and not source[end:line_end].strip()):
+                    start, end = line_start, line_end
+            
+            if start > position:
+                children.append(source[position:start])
+            position = end
+            
+            if match.group('path'):
+                includes.add(match.group('path'))
+                children.append((_INCLUDE, match.group('path'), _line(match.group('first')),
+                                 _line(match.group('last')), match.group(0)))
+                continue
+            
+            if name not in ('.', '@index'):
+                names.add(name)
+            
+            if not sigil:
+                children.append(_Placeholder(name))
+            elif sigil == '/':
+                if not stack or stack[-1][0] != name:
+                    line = source.count('\n', 0, match.start()) + 1
+                    raise ValueError(f"Unexpected {{{{/{name}}}}} on template line {line}")
+                stack.pop()
+                children = stack[-1][1] if stack else self.nodes
+            else:
+                flags = _SECTION | (_INVERTED if sigil == '^' else 0)
+                section = (flags, name, [])
+                children.append(section)
+                stack.append((name, section[2], match.start()))
+                children = section[2]
+        
+        if stack:
+            name, _, offset = stack[-1]
+            line = source.count('\n', 0, offset) + 1
+            raise ValueError(f"Unclosed {{{{#{name}}}}} opened on template line {line}")
+        if position < len(source):
+            children.append(source[position:])
+        
+        self.placeholders = frozenset(names)
+        self.includes = frozenset(includes)
+        self.digest = hash_text(source)
+    
+    def _iter_nodes(self, nodes, scopes, parts, state):
+        """
+        Append the rendered text of nodes to parts, yielding the joined
+        buffer whenever it grows past RENDER_FLUSH_PARTS entries.
+        """
+        for node in nodes:
+            if node.__class__ is str:
+                parts.append(node)
+            elif node.__class__ is _Placeholder:
+                value = _lookup(node, scopes)
+                if value is _MISSING:
+                    state.unresolved[node] = None
+                    parts.append(f"{{{{{node}}}}}")
+                else:
+                    value = str(value)
+                    if '{{' in value:
+                        value = state.expand_includes(value)
+                    parts.append(value)
+            elif node[0] == _INCLUDE:
+                parts.append(state.include(node[4], node[1], node[2], node[3]))
+            else:
+                flags, name, children = node
+                value = _lookup(name, scopes)
+                
+                if flags & _INVERTED:
+                    if value is _MISSING or not value:
+                        yield from self._iter_nodes(children, scopes, parts, state)
+                elif value is _MISSING:
+                    # Only top-level sections are required; nested ones are optional
+                    if len(scopes) == state.top:
+                        state.unresolved[name] = None
+                elif isinstance(value, (list, tuple)):
+                    for index, item in enumerate(value, 1):
+                        scopes.append({'.': item, '@index': index})
+                        if isinstance(item, dict):
+                            scopes.append(item)
+                        yield from self._iter_nodes(children, scopes, parts, state)
+                        if isinstance(item, dict):
+                            scopes.pop()
+                        scopes.pop()
+                elif isinstance(value, dict):
+                    scopes.append(value)
+                    yield from self._iter_nodes(children, scopes, parts, state)
+                    scopes.pop()
+                elif value:
+                    yield from self._iter_nodes(children, scopes, parts, state)
+            
+            if len(parts) >= RENDER_FLUSH_PARTS:
+                yield "".join(parts)
+                parts.clear()
+    
+    def iter_render(self, config: dict, report=None):
+        """
+        Render the template as a stream of text chunks.
+        
+        Chunks are yielded as rendering proceeds, so the complete output never
+        has to be held in memory. Legacy numbered keys are expanded into lists
+        first (see numbered_lists).
+        
+        Args:
+            config (dict): Mapping of placeholder names to values
+            report (dict): Optional dict that receives 'unused' (sorted config
+                keys the template never uses) before the first chunk, plus
+                'unresolved' (placeholder names missing from config, in
+                template order) and 'includes' (included path -> content hash),
+                both filled in as rendering proceeds
+        
+        Yields:
+            str: Consecutive pieces of the rendered output
+        """
+        derived, consumed = numbered_lists(config)
+        scopes = [config, derived] if derived else [config]
+        state = _RenderState(len(scopes))
+        if report is not None:
+            report['unresolved'] = state.unresolved
+            report['includes'] = state.includes
+            report['unused'] = sorted(set(config) - self.placeholders - consumed)
+        
+        parts = []
+        yield from self._iter_nodes(self.nodes, scopes, parts, state)
+        if parts:
+            yield "".join(parts)
+    
+    def render(self, config: dict):
+        """
+        Render the template with values from config in one pass.
+        
+        Placeholders with no matching config key are left in the output
+        unchanged so they remain visible in the generated page.
+        
+        Args:
+            config (dict): Mapping of placeholder names to values
+        
+        Returns:
+            tuple: (content, unresolved, unused) where unresolved is a list of
+            placeholder names missing from config (in template order) and
+            unused is a sorted list of config keys the template never uses
+        """
+        report = {}
+        content = "".join(self.iter_render(config, report))
+        return content, list(report['unresolved']), report['unused']
+
+
+def compile_template(source: str) -> CompiledTemplate:
+    """Compile template source text into a reusable CompiledTemplate."""
+    return CompiledTemplate(source)
+
+
+def load_template(template_path=TEMPLATE_PATH) -> CompiledTemplate:
+    """
+    Load and compile the session template.
+    
+    The compiled template is cached per path and only re-read when the
+    file's modification time changes.
+    """
+    template_path = Path(template_path)
     if not template_path.exists():
         raise FileNotFoundError(f"Template file not found: {template_path}")
     
+    cache_key = template_path.resolve()
+    mtime = template_path.stat().st_mtime_ns
+    cached = _template_cache.get(cache_key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
     with open(template_path, 'r') as f:
-        return f.read()
+        template = compile_template(f.read())
+    
+    _template_cache[cache_key] = (mtime, template)
+    return template
 
 def load_config(config_file):
     """Load configuration from JSON file."""
@@ -49,15 +498,24 @@ def interactive_config():
     config['SESSION_OVERVIEW'] = input("Session overview paragraph: ")
     
     # Learning objectives
-    print("\nEnter 5 learning objectives:")
-    for i in range(1, 6):
-        config[f'OBJECTIVE_{i}'] = input(f"Objective {i}: ")
+    print("\nEnter learning objectives (blank line to finish):")
+    config['objectives'] = []
+    while True:
+        objective = input(f"Objective {len(config['objectives']) + 1}: ")
+        if not objective:
+            break
+        config['objectives'].append(objective)
     
     # Session structure components
-    print("\nEnter 5 session structure components:")
-    for i in range(1, 6):
-        config[f'COMPONENT_{i}_NAME'] = input(f"Component {i} name: ")
-        config[f'COMPONENT_{i}_DESCRIPTION'] = input(f"Component {i} description: ")
+    print("\nEnter session structure components (blank name to finish):")
+    config['components'] = []
+    while True:
+        number = len(config['components']) + 1
+        name = input(f"Component {number} name: ")
+        if not name:
+            break
+        description = input(f"Component {number} description: ")
+        config['components'].append({'name': name, 'description': description})
     
     # Navigation
     prev_session = int(config['SESSION_NUMBER']) - 1
@@ -71,25 +529,42 @@ def interactive_config():
 
 def replace_placeholders(template, config):
     """Replace all placeholders in template with values from config."""
-    result = template
-    
-    for key, value in config.items():
-        placeholder = f"{{{{{key}}}}}"
-        result = result.replace(placeholder, str(value))
+    if not isinstance(template, CompiledTemplate):
+        template = compile_template(template)
     
-    return result
+    content, _, _ = template.render(config)
+    return content
+
+def report_status(status, output_file):
+    """Print the outcome of generating a single session file."""
+    if status == 'written':
+        print(f"✅ Session file generated: {output_file}")
+    elif status == 'unchanged':
+        print(f"✔️  Session file unchanged: {output_file}")
+    else:
+        print(f"⏭️  Session file up to date (skipped): {output_file}")
+
+def report_render_issues(unresolved, unused):
+    """Print warnings for unresolved placeholders and unused config keys."""
+    if unresolved:
+        print(f"⚠️  {len(unresolved)} placeholder(s) not found in config: "
+              f"{', '.join(unresolved)}")
+    if unused:
+        print(f"⚠️  {len(unused)} config key(s) not used by template: "
+              f"{', '.join(unused)}")
 
 def generate_navigation_config(session_num, session_title, components):
     """Generate navigation configuration for mkdocs.yml."""
     session_file = f"sessions/session-{session_num:02d}.md"
     
-    nav_config = f"""  - Week {session_num} - {session_title}:
+    # Titles are quoted so ": " or " #" in them cannot break the YAML
+    week_title = json.dumps(f"Week {session_num} - {session_title}")
+    nav_config = f"""  - {week_title}:
     - Session {session_num}: {session_file}"""
     
     for i, (name, _) in enumerate(components, 1):
-        anchor = name.lower().replace(' ', '-').replace(':', '').replace('&', '').replace(',', '')
-        anchor = re.sub(r'[^\w-]', '', anchor)  # Remove special characters
-        nav_config += f"\n    - {name}: '{session_file[:-3]}/#{anchor}'"
+        anchor = slugify(name)  # Same slugs as the toc extension
+        nav_config += f"\n    - {json.dumps(name)}: '{session_file[:-3]}/#{anchor}'"
     
     nav_config += f"\n    - Resources: downloads.md\n    - Assessment: assessment.md"
     
@@ -109,46 +584,45 @@ def create_config_template(session_num):
         "SESSION_OVERVIEW": "Detailed overview paragraph goes here.",
         
         # Learning objectives
-        "OBJECTIVE_1": "First learning objective",
-        "OBJECTIVE_2": "Second learning objective", 
-        "OBJECTIVE_3": "Third learning objective",
-        "OBJECTIVE_4": "Fourth learning objective",
-        "OBJECTIVE_5": "Fifth learning objective",
+        "objectives": [
+            "First learning objective",
+            "Second learning objective",
+            "Third learning objective",
+            "Fourth learning objective",
+            "Fifth learning objective",
+        ],
         
         # Session structure
-        "COMPONENT_1_NAME": "Theory Session",
-        "COMPONENT_1_DESCRIPTION": "Core theoretical concepts",
-        "COMPONENT_2_NAME": "Hands-on Exercise",
-        "COMPONENT_2_DESCRIPTION": "Practical implementation",
-        "COMPONENT_3_NAME": "Live Demonstration", 
-        "COMPONENT_3_DESCRIPTION": "Instructor demonstration",
-        "COMPONENT_4_NAME": "Extension Activity",
-        "COMPONENT_4_DESCRIPTION": "Advanced concepts",
-        "COMPONENT_5_NAME": "Lab Setup",
-        "COMPONENT_5_DESCRIPTION": "Environment configuration",
-        
-        # Content sections
-        "SECTION_1_TITLE": "Main Concept Introduction",
-        "SECTION_1_CONTENT": "Content for first major section",
-        "SECTION_2_TITLE": "Advanced Topics", 
-        "SECTION_2_CONTENT": "Content for second major section",
-        "SECTION_3_TITLE": "Practical Applications",
-        "SECTION_3_CONTENT": "Content for third section",
-        "SECTION_4_TITLE": "Implementation Details",
-        "SECTION_4_CONTENT": "Content for fourth section",
-        "SECTION_5_TITLE": "Best Practices",
-        "SECTION_5_CONTENT": "Content for fifth section",
+        "components": [
+            {"name": "Theory Session", "description": "Core theoretical concepts"},
+            {"name": "Hands-on Exercise", "description": "Practical implementation"},
+            {"name": "Live Demonstration", "description": "Instructor demonstration"},
+            {"name": "Extension Activity", "description": "Advanced concepts"},
+            {"name": "Lab Setup", "description": "Environment configuration"},
+        ],
+        
+        # Content sections (each may list its own subsections)
+        "sections": [
+            {"title": "Main Concept Introduction", "content": "Content for first major section",
+             "subsections": [{"title": "Key Idea", "content": "Content for the first subsection"}]},
+            {"title": "Advanced Topics", "content": "Content for second major section"},
+            {"title": "Practical Applications", "content": "Content for third section"},
+            {"title": "Implementation Details", "content": "Content for fourth section"},
+            {"title": "Best Practices", "content": "Content for fifth section"},
+        ],
         
         # Hands-on section
         "HANDS_ON_TITLE": "Hands-on Exercise: Your Exercise Title",
         "HANDS_ON_DESCRIPTION": "Description of the hands-on activity",
         "TASK_TITLE": "Create Your Implementation",
         "TASK_DESCRIPTION": "Detailed task description",
-        "STEP_1": "First implementation step",
-        "STEP_2": "Second implementation step", 
-        "STEP_3": "Third implementation step",
-        "STEP_4": "Fourth implementation step",
-        "STEP_5": "Fifth implementation step",
+        "steps": [
+            "First implementation step",
+            "Second implementation step",
+            "Third implementation step",
+            "Fourth implementation step",
+            "Fifth implementation step",
+        ],
         "CODE_TEMPLATE": "# Your code template here\nclass ExampleClass:\n    pass",
         "EXTENSION_CHALLENGE": "Advanced challenge description",
         
@@ -162,12 +636,459 @@ def create_config_template(session_num):
     
     return config_template
 
+def default_output_path(config):
+    """Return the default docs/sessions output path for a session config."""
+    session_num = str(config.get('SESSION_NUMBER', '00'))
+    if session_num.isdigit():
+        session_num = f"{int(session_num):02d}"
+    return f"docs/sessions/session-{session_num}.md"
+
+def session_navigation(config):
+    """Build the mkdocs.yml navigation snippet for a session config."""
+    session_num = int(config.get('SESSION_NUMBER', 0))
+    session_title = config.get('SESSION_TITLE', 'Session Title')
+    context, _ = expand_numbered_keys(config)
+    components = [(component.get('name', f'Component {i}'), component.get('description', ''))
+                  for i, component in enumerate(context.get('components', []), 1)]
+    
+    return generate_navigation_config(session_num, session_title, components)
+
+def hash_config(config: dict) -> str:
+    """Return a stable hash of a config, independent of key order and formatting."""
+    digest = hashlib.sha256()
+    encoder = json.JSONEncoder(sort_keys=True, ensure_ascii=False)
+    parts = []
+    
+    # Hash the canonical JSON incrementally rather than building the full string
+    for part in encoder.iterencode(config):
+        parts.append(part)
+        if len(parts) >= RENDER_FLUSH_PARTS:
+            digest.update("".join(parts).encode('utf-8'))
+            parts.clear()
+    digest.update("".join(parts).encode('utf-8'))
+    return digest.hexdigest()
+
+def hash_file(path):
+    """Return the SHA-256 hex digest of a file's contents, or None if it is missing."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(WRITE_BUFFER_SIZE), b''):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+def load_manifest(manifest_path=MANIFEST_PATH):
+    """
+    Load the generation manifest.
+    
+    The manifest maps each output file to the template, config and output
+    hashes recorded when it was last generated. A missing or unreadable
+    manifest is treated as empty.
+    """
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    
+    return manifest if isinstance(manifest, dict) else {}
+
+def save_manifest(manifest, manifest_path=MANIFEST_PATH):
+    """Write the generation manifest, sorted for stable diffs."""
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def write_chunks(chunks, path):
+    """
+    Write text chunks to a new file as UTF-8 through a large buffer.
+    
+    Returns:
+        str: SHA-256 hex digest of the written bytes
+    """
+    digest = hashlib.sha256()
+    with open(path, 'xb', buffering=WRITE_BUFFER_SIZE) as f:
+        for chunk in chunks:
+            data = chunk.encode('utf-8')
+            digest.update(data)
+            f.write(data)
+    return digest.hexdigest()
+
+def write_session(template, config, output_file, manifest_entry=None, force=False):
+    """
+    Render a session config and write it to output_file.
+    
+    Rendering is skipped when the manifest entry shows the same template,
+    config and included files produced the file currently on disk. Otherwise the template is
+    rendered chunk by chunk into a buffered temporary file next to the output,
+    hashing as it goes, and then atomically renamed over output_file. If the
+    rendered content is identical to the existing file the temporary file is
+    discarded instead, so the original's mtime is left untouched. Pass
+    force=True to always render and write.
+    
+    An existing file that differs from the rendered session is only replaced
+    if the manifest shows this script wrote it and it has not been edited
+    since; hand-written or hand-edited files need force=True.
+    
+    Args:
+        template (CompiledTemplate): Compiled session template
+        config (dict): Session configuration
+        output_file (str): Destination path
+        manifest_entry (dict): Previous manifest entry for output_file, if any
+        force (bool): Ignore the manifest and existing output
+    
+    Returns:
+        tuple: (status, unresolved, unused, entry) where status is one of
+        'written', 'unchanged' or 'skipped' and entry is the new manifest entry
+    
+    Raises:
+        FileExistsError: If output_file would replace a file not produced by
+            this script (no manifest entry, or edited since it was written)
+    """
+    config_hash = hash_config(config)
+    
+    if (not force and manifest_entry
+            and manifest_entry.get('template') == template.digest
+            and manifest_entry.get('config') == config_hash
+            and all(source_digest(path) == digest
+                    for path, digest in manifest_entry.get('includes', {}).items())
+            and hash_file(output_file) == manifest_entry.get('output')):
+        return ('skipped', manifest_entry.get('unresolved', []),
+                manifest_entry.get('unused', []), manifest_entry)
+    
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    report = {}
+    temp_file = f"{output_file}.{os.getpid()}.tmp"
+    try:
+        output_hash = write_chunks(template.iter_render(config, report), temp_file)
+        existing_hash = hash_file(output_file)
+        if not force and existing_hash == output_hash:
+            os.remove(temp_file)
+            status = 'unchanged'
+        elif (not force and existing_hash is not None
+                and existing_hash != (manifest_entry or {}).get('output')):
+            raise FileExistsError(f"{output_file} was not generated by this script or has "
+                                  f"been edited since; use --force to replace it")
+        else:
+            os.replace(temp_file, output_file)
+            status = 'written'
+    except BaseException:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+    
+    unresolved = list(report['unresolved'])
+    entry = {
+        'template': template.digest,
+        'config': config_hash,
+        'output': output_hash,
+        'includes': dict(sorted(report['includes'].items())),
+        'unresolved': unresolved,
+        'unused': report['unused'],
+    }
+    return status, unresolved, report['unused'], entry
+
+def find_config_files(config_dir, pattern="session_*_config.json"):
+    """Return the sorted list of config files in config_dir matching pattern."""
+    config_dir = Path(config_dir)
+    if not config_dir.is_dir():
+        raise FileNotFoundError(f"Config directory not found: {config_dir}")
+    
+    return sorted(str(path) for path in config_dir.glob(pattern))
+
+# State shared by batch worker processes (set by _init_worker)
+_worker_template = None
+_worker_manifest = {}
+_worker_force = False
+
+def _init_worker(template, manifest, force, sources):
+    """
+    Process pool initializer: receive the compiled template, manifest and
+    already-read include sources once per worker.
+    """
+    global _worker_template, _worker_manifest, _worker_force
+    _worker_template = template
+    _worker_manifest = manifest
+    _worker_force = force
+    _source_cache.update(sources)
+
+def generate_config_file(config_file, template, manifest=None, force=False):
+    """
+    Load, render and write a single session config.
+    
+    Returns:
+        dict: Result with output path, status, new manifest entry,
+        navigation snippet, render issues and elapsed time
+    """
+    started = time.perf_counter()
+    config = load_config(config_file)
+    output_file = default_output_path(config)
+    status, unresolved, unused, entry = write_session(
+        template, config, output_file, (manifest or {}).get(output_file), force)
+    
+    return {
+        'config_file': config_file,
+        'output_file': output_file,
+        'status': status,
+        'manifest_entry': entry,
+        'session_number': int(config.get('SESSION_NUMBER', 0)),
+        'navigation': session_navigation(config),
+        'unresolved': unresolved,
+        'unused': unused,
+        'elapsed': time.perf_counter() - started,
+    }
+
+def _generate_from_config_file(config_file):
+    """Batch worker: generate one config using the per-process shared state."""
+    return generate_config_file(config_file, _worker_template, _worker_manifest, _worker_force)
+
+def generate_batch(config_files, template, jobs=None, manifest=None, force=False):
+    """
+    Render and write many session configs across a process pool.
+    
+    The compiled template is handed to each worker once through the pool
+    initializer rather than being pickled with every task. Files included by
+    the template itself are read here first and passed along with it, so
+    workers do not each read them again.
+    
+    Args:
+        config_files (list): Paths of JSON config files to generate
+        template (CompiledTemplate): Compiled session template
+        jobs (int): Number of worker processes (default: CPU count)
+        manifest (dict): Generation manifest used to skip unchanged outputs
+        force (bool): Render and write every config regardless of the manifest
+    
+    Returns:
+        tuple: (results, failures) where results are worker result dicts
+        sorted by session number and failures are (config_file, error) pairs
+    """
+    results = []
+    failures = []
+    
+    for path in template.includes:
+        source_digest(path)
+    
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(template, manifest or {}, force,
+                                       dict(_source_cache))) as pool:
+        futures = {pool.submit(_generate_from_config_file, config_file): config_file
+                   for config_file in config_files}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as error:
+                failures.append((futures[future], error))
+    
+    results.sort(key=lambda result: (result['session_number'], result['config_file']))
+    return results, failures
+
+def apply_navigation(results, mkdocs_path=MKDOCS_PATH):
+    """Merge the generated week entries into mkdocs.yml and report the outcome."""
+    week_snippets = {result['session_number']: result['navigation'] for result in results}
+    if not week_snippets:
+        return
+    
+    try:
+        changed = update_mkdocs_nav(week_snippets, mkdocs_path)
+    except (OSError, ValueError, yaml.YAMLError) as error:
+        print(f"❌ Could not update {mkdocs_path} navigation: {error}")
+        return
+    
+    if changed:
+        print(f"📝 Updated {mkdocs_path} navigation for week(s) "
+              f"{', '.join(str(week) for week in sorted(week_snippets))}")
+    else:
+        print(f"✔️  {mkdocs_path} navigation already up to date")
+
+def report_batch(results, failures, wall_clock, show_navigation=True):
+    """Print statuses, render issues, the combined nav block and timings for a batch."""
+    for result in results:
+        report_status(result['status'], result['output_file'])
+        report_render_issues(result['unresolved'], result['unused'])
+    for config_file, error in failures:
+        print(f"❌ Failed to generate from {config_file}: {error}")
+    
+    if show_navigation and results:
+        print("\n📋 Add this to your mkdocs.yml navigation:")
+        print("\n".join(result['navigation'] for result in results))
+    
+    print("\n⏱️  Timing:")
+    for result in results:
+        print(f"  {result['config_file']} -> {result['output_file']}: "
+              f"{result['elapsed'] * 1000:.1f} ms ({result['status']})")
+    written = sum(1 for result in results if result['status'] == 'written')
+    print(f"  {written} written, {len(results) - written} up to date, "
+          f"{len(failures)} failed in {wall_clock * 1000:.1f} ms wall clock")
+
+def run_batch(config_dir, pattern, jobs=None, force=False, update_nav=False):
+    """
+    Generate every matching config in config_dir and print a combined summary.
+    
+    Returns:
+        list: (config_file, error) pairs for configs that failed to generate
+    """
+    started = time.perf_counter()
+    config_files = find_config_files(config_dir, pattern)
+    if not config_files:
+        print(f"No config files matching '{pattern}' in {config_dir}")
+        return []
+    
+    template = load_template()
+    manifest = load_manifest()
+    results, failures = generate_batch(config_files, template, jobs, manifest, force)
+    
+    for result in results:
+        manifest[result['output_file']] = result['manifest_entry']
+    save_manifest(manifest)
+    
+    report_batch(results, failures, time.perf_counter() - started,
+                 show_navigation=not update_nav)
+    if update_nav:
+        apply_navigation(results)
+    return failures
+
+def _watch_snapshot(config_dir, pattern, extra_paths=()):
+    """Return {path: mtime_ns} for the template, every matching config and extra_paths."""
+    snapshot = {}
+    paths = [str(TEMPLATE_PATH)] + find_config_files(config_dir, pattern) + sorted(extra_paths)
+    for path in paths:
+        try:
+            snapshot[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            pass
+    return snapshot
+
+def _record_includes(results, include_users):
+    """Update the included path -> set of config files map from generation results."""
+    for result in results:
+        config_file = result['config_file']
+        for users in include_users.values():
+            users.discard(config_file)
+        for path in result['manifest_entry'].get('includes', {}):
+            include_users.setdefault(path, set()).add(config_file)
+    
+    for path in [path for path, users in include_users.items() if not users]:
+        del include_users[path]
+
+def watch(config_dir, pattern, jobs=None, interval=0.5, debounce=0.3, update_nav=False):
+    """
+    Watch the template, config files and included sources, regenerating
+    sessions as they change.
+    
+    Every session is brought up to date once on start-up, which also records
+    which files each session includes. The compiled template and manifest
+    then stay in memory between rebuilds. Files are polled every `interval`
+    seconds; once a change is seen, regeneration waits until nothing has
+    changed for `debounce` seconds so that editors saving several files at
+    once trigger a single rebuild. A template change regenerates every session
+    across the process pool, while config and included file changes regenerate
+    only the affected sessions in this process.
+    
+    Args:
+        config_dir (str): Directory containing session configs
+        pattern (str): Config file glob pattern
+        jobs (int): Worker processes for template fan-out (default: CPU count)
+        interval (float): Polling interval in seconds
+        debounce (float): Quiet period in seconds before regenerating
+        update_nav (bool): Merge regenerated week entries into mkdocs.yml
+    """
+    template = load_template()
+    manifest = load_manifest()
+    include_users = {}
+    
+    def finish(results, failures, started):
+        for result in results:
+            manifest[result['output_file']] = result['manifest_entry']
+        save_manifest(manifest)
+        _record_includes(results, include_users)
+        
+        report_batch(results, failures, time.perf_counter() - started,
+                     show_navigation=False)
+        if update_nav:
+            apply_navigation(results)
+    
+    started = time.perf_counter()
+    config_files = find_config_files(config_dir, pattern)
+    results, failures = generate_batch(config_files, template, jobs, manifest)
+    finish(results, failures, started)
+    previous = _watch_snapshot(config_dir, pattern, include_users)
+    
+    print(f"\n👀 Watching {TEMPLATE_PATH}, {config_dir}/{pattern} and "
+          f"{len(include_users)} included file(s) (Ctrl+C to stop)")
+    
+    try:
+        while True:
+            time.sleep(interval)
+            current = _watch_snapshot(config_dir, pattern, include_users)
+            if current == previous:
+                continue
+            
+            # Wait for the files to settle before regenerating
+            while True:
+                time.sleep(debounce)
+                settled = _watch_snapshot(config_dir, pattern, include_users)
+                if settled == current:
+                    break
+                current = settled
+            
+            changed = sorted(path for path, mtime in current.items()
+                             if previous.get(path) != mtime)
+            previous = current
+            if not changed:
+                continue
+            
+            started = time.perf_counter()
+            if str(TEMPLATE_PATH) in changed:
+                try:
+                    template = load_template()
+                except (FileNotFoundError, ValueError) as error:
+                    # Half-edited template: keep serving the last good one
+                    print(f"❌ {error}; keeping the previous template")
+                    continue
+                config_files = find_config_files(config_dir, pattern)
+                print(f"\n🔄 Template changed, regenerating {len(config_files)} session(s)")
+                results, failures = generate_batch(config_files, template, jobs, manifest)
+            else:
+                affected = set()
+                for path in changed:
+                    affected.update(include_users.get(path, {path}))
+                print(f"\n🔄 {len(changed)} file(s) changed, regenerating {len(affected)} session(s)")
+                results, failures = [], []
+                for config_file in sorted(affected):
+                    try:
+                        results.append(generate_config_file(config_file, template, manifest))
+                    except Exception as error:
+                        failures.append((config_file, error))
+            
+            finish(results, failures, started)
+            previous = _watch_snapshot(config_dir, pattern, include_users)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
 def main():
     parser = argparse.ArgumentParser(description='Generate session files from template')
     parser.add_argument('--config', help='JSON configuration file path')
     parser.add_argument('--interactive', action='store_true', help='Interactive configuration mode')
     parser.add_argument('--create-config', type=int, help='Create configuration template for session number')
     parser.add_argument('--output', help='Output file path (default: auto-generated)')
+    parser.add_argument('--config-dir', help='Generate every config in this directory')
+    parser.add_argument('--glob', default='session_*_config.json',
+                        help='Config file pattern used with --config-dir (default: session_*_config.json)')
+    parser.add_argument('--jobs', type=int, help='Worker processes for --config-dir (default: CPU count)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Watch the template and --config-dir (default: configs) and regenerate on change')
+    parser.add_argument('--debounce', type=float, default=0.3,
+                        help='Seconds of quiet before regenerating in --watch mode (default: 0.3)')
+    parser.add_argument('--update-nav', action='store_true',
+                        help=f'Merge the generated week entries into {MKDOCS_PATH} instead of printing them')
+    parser.add_argument('--force', action='store_true',
+                        help=f'Regenerate even if {MANIFEST_PATH} shows nothing changed, '
+                             f'and replace session files that were not generated or were edited')
     
     args = parser.parse_args()
     
@@ -185,53 +1106,58 @@ def main():
         print(f"python scripts/generate_session.py --config {config_file}")
         return
     
+    if args.watch:
+        watch(args.config_dir or 'configs', args.glob, args.jobs,
+              debounce=args.debounce, update_nav=args.update_nav)
+        return
+    
+    if args.config_dir:
+        if run_batch(args.config_dir, args.glob, args.jobs, args.force, args.update_nav):
+            sys.exit(1)
+        return
+    
     # Load configuration
     if args.config:
         config = load_config(args.config)
     elif args.interactive:
         config = interactive_config()
     else:
-        print("Error: Must specify either --config or --interactive")
+        print("Error: Must specify --config, --config-dir or --interactive")
         parser.print_help()
         return
     
     # Load and process template
     template = load_template()
-    session_content = replace_placeholders(template, config)
-    
-    # Determine output file
-    if args.output:
-        output_file = args.output
-    else:
-        session_num = config.get('SESSION_NUMBER', '00')
-        output_file = f"docs/sessions/session-{session_num}.md"
-    
-    # Write session file
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    with open(output_file, 'w') as f:
-        f.write(session_content)
+    output_file = args.output or default_output_path(config)
+    manifest = load_manifest()
+    try:
+        status, unresolved, unused, entry = write_session(
+            template, config, output_file, manifest.get(output_file), args.force)
+    except FileExistsError as error:
+        print(f"❌ {error}")
+        sys.exit(1)
+    manifest[output_file] = entry
+    save_manifest(manifest)
     
-    print(f"✅ Session file generated: {output_file}")
+    report_status(status, output_file)
+    report_render_issues(unresolved, unused)
     
     # Generate navigation configuration
-    session_num = int(config.get('SESSION_NUMBER', 0))
-    session_title = config.get('SESSION_TITLE', 'Session Title')
-    components = [
-        (config.get('COMPONENT_1_NAME', 'Component 1'), ''),
-        (config.get('COMPONENT_2_NAME', 'Component 2'), ''),
-        (config.get('COMPONENT_3_NAME', 'Component 3'), ''),
-        (config.get('COMPONENT_4_NAME', 'Component 4'), ''),
-        (config.get('COMPONENT_5_NAME', 'Component 5'), ''),
-    ]
-    
-    nav_config = generate_navigation_config(session_num, session_title, components)
+    nav_config = session_navigation(config)
     
-    print("\n📋 Add this to your mkdocs.yml navigation:")
-    print(nav_config)
+    if args.update_nav:
+        apply_navigation([{'session_number': int(config.get('SESSION_NUMBER', 0)),
+                           'navigation': nav_config}])
+    else:
+        print("\n📋 Add this to your mkdocs.yml navigation:")
+        print(nav_config)
     
     print(f"\n🎯 Next steps:")
     print(f"1. Review and edit the generated file: {output_file}")
-    print(f"2. Add the navigation configuration to mkdocs.yml")
+    if args.update_nav:
+        print(f"2. Check the updated navigation in mkdocs.yml")
+    else:
+        print(f"2. Add the navigation configuration to mkdocs.yml")
     print(f"3. Create any required resource files in docs/files/")
     print(f"4. Add download links to docs/downloads.md")
 
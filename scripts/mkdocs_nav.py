@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+MkDocs Navigation Patcher
+Merges generated week entries into the nav: section of mkdocs.yml in place.
+
+The file is parsed once with PyYAML's composer, which records the line span
+of every nav entry without constructing values, so custom tags such as
+!!python/name are never evaluated. Entries are then spliced into the original
+text line by line, leaving comments, tags and formatting elsewhere untouched.
+The file is only rewritten when the resulting text actually differs.
+"""
+
+import re
+from pathlib import Path
+
+import yaml
+
+MKDOCS_PATH = Path("mkdocs.yml")
+
+# Matches nav titles such as "Week 5 - Advanced Class Features"
+WEEK_TITLE_PATTERN = re.compile(r"^Week\s+(\d+)\b")
+
+
+def _last_line(node):
+    """Return the last source line (0-based) holding content of a YAML node."""
+    if isinstance(node, yaml.SequenceNode) and node.value:
+        return _last_line(node.value[-1])
+    if isinstance(node, yaml.MappingNode) and node.value:
+        return _last_line(node.value[-1][1])
+    return node.end_mark.line
+
+
+def _find_nav_node(root):
+    """Return the SequenceNode for the top-level nav: key, or None."""
+    if not isinstance(root, yaml.MappingNode):
+        return None
+    for key, value in root.value:
+        if key.value == 'nav' and isinstance(value, yaml.SequenceNode):
+            return value
+    return None
+
+
+def find_week_entries(nav):
+    """
+    Find every "Week N - ..." entry in the nav tree.
+
+    Args:
+        nav (yaml.SequenceNode): Composed nav sequence
+
+    Returns:
+        dict: Week number -> (first_line, end_line, indent) where the line
+        range is half-open and indent is the column of the entry's "- "
+    """
+    entries = {}
+    pending = [nav]
+
+    while pending:
+        sequence = pending.pop()
+        for item in sequence.value:
+            if not isinstance(item, yaml.MappingNode) or len(item.value) != 1:
+                continue
+            key, value = item.value[0]
+            match = WEEK_TITLE_PATTERN.match(str(key.value))
+            if match:
+                entries[int(match.group(1))] = (
+                    item.start_mark.line, _last_line(item) + 1, item.start_mark.column - 2)
+            elif isinstance(value, yaml.SequenceNode):
+                pending.append(value)
+
+    return entries
+
+
+def nav_targets(text):
+    """
+    List every page target in the nav: section of mkdocs.yml text.
+
+    Returns:
+        list: (title, target) pairs in nav order; untitled entries use the
+        target as their title
+    """
+    nav = _find_nav_node(yaml.compose(text, Loader=yaml.SafeLoader))
+    targets = []
+
+    def collect(sequence):
+        for item in sequence.value:
+            if isinstance(item, yaml.ScalarNode):
+                targets.append((item.value, item.value))
+            elif isinstance(item, yaml.MappingNode):
+                for key, value in item.value:
+                    if isinstance(value, yaml.ScalarNode):
+                        targets.append((key.value, value.value))
+                    elif isinstance(value, yaml.SequenceNode):
+                        collect(value)
+
+    if nav is not None:
+        collect(nav)
+    return targets
+
+
+def _reindent(snippet, indent):
+    """Re-indent a generated nav snippet so its first "- " starts at column indent."""
+    lines = snippet.splitlines()
+    base = len(lines[0]) - len(lines[0].lstrip())
+    return [" " * indent + line[base:] for line in lines]
+
+
+def patch_nav_text(text, week_snippets):
+    """
+    Merge week navigation snippets into mkdocs.yml text.
+
+    Existing "Week N" entries are replaced in place. Missing weeks are
+    inserted after the closest earlier week, or at the end of nav when
+    there is none.
+
+    Args:
+        text (str): Current mkdocs.yml contents
+        week_snippets (dict): Week number -> snippet from generate_navigation_config
+
+    Returns:
+        str: Patched mkdocs.yml contents (identical to text if nothing changed)
+    """
+    nav = _find_nav_node(yaml.compose(text, Loader=yaml.SafeLoader))
+    if nav is None or not nav.value:
+        raise ValueError("mkdocs.yml has no nav: list to patch")
+
+    existing = find_week_entries(nav)
+    nav_end = _last_line(nav) + 1
+    nav_indent = nav.value[0].start_mark.column - 2
+
+    # (start, end, week, lines) splices computed against the original parse
+    splices = []
+    for week, snippet in week_snippets.items():
+        if week in existing:
+            start, end, indent = existing[week]
+        else:
+            earlier = [number for number in existing if number < week]
+            if earlier:
+                _, start, indent = existing[max(earlier)]
+            else:
+                start, indent = nav_end, nav_indent
+            end = start
+        splices.append((start, end, week, _reindent(snippet, indent)))
+
+    lines = text.splitlines(keepends=True)
+    newline = "\r\n" if lines and lines[0].endswith("\r\n") else "\n"
+    if lines and not lines[-1].endswith(("\n", "\r")):
+        lines[-1] += newline
+
+    # Apply bottom-up so earlier splices keep their original line numbers
+    for start, end, _, new_lines in sorted(splices, key=lambda splice: splice[:3], reverse=True):
+        lines[start:end] = [line + newline for line in new_lines]
+
+    patched = "".join(lines)
+    if not text.endswith(("\n", "\r")):
+        patched = patched[:-len(newline)]
+    return patched
+
+
+def update_mkdocs_nav(week_snippets, mkdocs_path=MKDOCS_PATH):
+    """
+    Patch the week entries in mkdocs.yml, writing only if the nav changed.
+
+    Args:
+        week_snippets (dict): Week number -> snippet from generate_navigation_config
+        mkdocs_path (str): Path to mkdocs.yml
+
+    Returns:
+        bool: True if the file was rewritten
+    """
+    with open(mkdocs_path, 'r', newline='') as f:
+        text = f.read()
+
+    patched = patch_nav_text(text, week_snippets)
+    if patched == text:
+        return False
+
+    # Refuse to write anything the YAML parser would reject
+    yaml.compose(patched, Loader=yaml.SafeLoader)
+
+    with open(mkdocs_path, 'w', newline='') as f:
+        f.write(patched)
+    return True